@@ -1,14 +1,18 @@
 """ham.core._internal._import_utils"""
 
-from typing import Any, Callable, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import inspect
 import ast
 import hashlib
 
 
-class TypeCheckingImporterError(Exception):
+class TypeCheckingImporterError(AttributeError):
     """An error that occurs when the `_type_checking_importer` function
-    fails to create a lazy loader function."""
+    fails to create a lazy loader function, or a lazy loader cannot
+    resolve an attribute.
+
+    Subclasses `AttributeError` so that `hasattr` and `getattr(..., default)`
+    probes against lazily loaded modules behave as they would on any module."""
 
 
 class TypeCheckingImporterCache:
@@ -60,6 +64,11 @@ GETATTR_IMPORTER_TYPE_CHECKING_CACHE = {}
 """Cache for the `_parse_type_checking_imports` function."""
 
 
+_ABSOLUTE_IMPORT_PREFIXES = ("litellm", "openai", "instructor", "httpx", "ham")
+"""Module prefixes within `TYPE_CHECKING` blocks that are kept as absolute
+imports (third-party and internal `ham` modules)."""
+
+
 def _parse_type_checking_imports(source_code: str) -> dict[str, tuple[str, str]]:
     """Parses the TYPE_CHECKING imports from a source code file, to create
     a dictionary of local names to (module_path, original_name) tuples.
@@ -109,16 +118,7 @@ def _parse_type_checking_imports(source_code: str) -> dict[str, tuple[str, str]]
                                 elif stmt.module.startswith("."):
                                     # Explicit relative import
                                     module_path = stmt.module
-                                elif any(
-                                    stmt.module.startswith(name)
-                                    for name in [
-                                        "litellm",
-                                        "openai",
-                                        "instructor",
-                                        "httpx",
-                                        "ham",
-                                    ]
-                                ):
+                                elif stmt.module.startswith(_ABSOLUTE_IMPORT_PREFIXES):
                                     # Known absolute imports (third-party and internal ham modules)
                                     module_path = stmt.module
                                 else:
@@ -147,6 +147,7 @@ def _type_checking_importer_from_import_dict(
     imports_dict: dict[str, tuple[str, str]],
     package: str,
     all_attrs: Union[Tuple[str, ...], List[str]],
+    module_globals: Optional[Dict[str, Any]] = None,
 ) -> Callable[[str], Any]:
     """Creates a lazy loader function for the `__getattr__` method
     within `__init__.py` modules in Python packages.
@@ -155,6 +156,10 @@ def _type_checking_importer_from_import_dict(
         imports_dict : Dictionary mapping attribute names to (module_path, original_name) tuples
         package : The package name for import_module
         all_attrs : List of all valid attributes for this module
+        module_globals : The namespace of the module the loader is installed
+            on. Resolved attributes and submodules are stored here, so that
+            later accesses are plain attribute lookups that never reach
+            `__getattr__`.
 
     Returns:
         A __getattr__ function that lazily imports modules
@@ -162,23 +167,38 @@ def _type_checking_importer_from_import_dict(
     from importlib import import_module
 
     cache = {}
+    missing = object()
 
     def __getattr__(name: str) -> Any:
-        if name in cache:
-            return cache[name]
+        result = cache.get(name, missing)
+        if result is not missing:
+            return result
 
-        if name in imports_dict:
-            module_path, original_name = imports_dict[name]
+        import_path = imports_dict.get(name)
+        if import_path is not None:
+            module_path, original_name = import_path
             module = import_module(module_path, package)
             result = getattr(module, original_name)
             cache[name] = result
+            if module_globals is not None:
+                module_globals[name] = result
             return result
 
+        # Dunder probes (`__wrapped__`, `__path__`, ...) from introspection
+        # tools are never lazy exports or submodules, so fail fast instead
+        # of going through the import system for each of them
+        if name[:2] == "__" == name[-2:]:
+            raise TypeCheckingImporterError(
+                f"module '{package}' has no attribute '{name}'"
+            )
+
         # Try to import as a submodule
         try:
             module_path = f".{name}"
             module = import_module(module_path, package)
             cache[name] = module
+            if module_globals is not None:
+                module_globals[name] = module
             return module
         except ImportError:
             pass
@@ -233,7 +253,7 @@ def type_checking_importer(
     filename = calling_frame.f_globals.get("__file__", "")
 
     # Check cache first
-    cache_key = (filename, tuple(all))
+    cache_key = (filename, module_name, tuple(all))
     if cache_key in GETATTR_IMPORTER_TYPE_CHECKING_CACHE:
         return GETATTR_IMPORTER_TYPE_CHECKING_CACHE[cache_key]
 
@@ -257,7 +277,9 @@ def type_checking_importer(
     # Filter to only include exports that are in __all__
     filtered_map = {name: path for name, path in imports_map.items() if name in all}
 
-    loader = _type_checking_importer_from_import_dict(filtered_map, package, all)
+    loader = _type_checking_importer_from_import_dict(
+        filtered_map, package, all, calling_frame.f_globals
+    )
     GETATTR_IMPORTER_TYPE_CHECKING_CACHE[cache_key] = loader
     return loader
 
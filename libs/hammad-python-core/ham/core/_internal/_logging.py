@@ -48,7 +48,9 @@ handler.setFormatter(logging.Formatter("| [bold]{name}[/bold] - {message}", styl
 handler.addFilter(RichMarkupFilter())
 
 
-if not any(isinstance(h, RichHandler) for h in logger.handlers):
+if not any(
+    type(h) is RichHandler or isinstance(h, RichHandler) for h in logger.handlers
+):
     logger.addHandler(handler)
 
 
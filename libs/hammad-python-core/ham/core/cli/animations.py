@@ -1,5 +1,6 @@
 """ham.core.cli.animations"""
 
+import copy
 import time
 import math
 import random
@@ -10,8 +11,9 @@ from typing import Literal, Optional, List
 from rich import get_console
 from rich.console import Console, ConsoleOptions, RenderResult, RenderableType
 from rich.live import Live
-from rich.text import Text
+from rich.text import Span, Text
 from rich.panel import Panel
+from rich.style import Style
 
 from .styles.types import (
     CLIStyleColorName,
@@ -36,14 +38,23 @@ __all__ = (
 )
 
 
-@dataclass
+def _to_ns(seconds: float) -> int:
+    """Converts a positive duration in seconds to whole nanoseconds, at
+    least 1."""
+    return max(1, int(seconds * 1_000_000_000))
+
+
+@dataclass(slots=True)
 class CLIAnimationState:
     """Internal class used to track the current state of an
     animation."""
 
-    start_time: float = field(default_factory=time.time)
+    start_ns: int = field(default_factory=time.monotonic_ns)
     frame: int = 0
-    last_update: float | None = field(default_factory=time.time)
+    last_update: int | None = field(default_factory=time.monotonic_ns)
+    elapsed_ns: int | None = None
+    """Nanoseconds elapsed as of the frame being rendered, read once per
+    frame."""
 
 
 @dataclass
@@ -51,6 +62,17 @@ class CLIAnimation:
     """Base class for all animations within the `hammad` package,
     this is used to integrate with rich's `__rich_console__` protocol."""
 
+    # Subclasses declare slots for their own attributes as well
+    __slots__ = (
+        "renderable",
+        "duration",
+        "state",
+        "rich_console",
+        "_animation_thread",
+        "_stop_animation",
+        "_stop_event",
+    )
+
     def __init__(
         self,
         # The object that this animation is being applied to.
@@ -72,6 +94,8 @@ class CLIAnimation:
         """The thread responsible for running the animation."""
         self._stop_animation = False
         """Flag used to stop the animation."""
+        self._stop_event = threading.Event()
+        """Event waited on while the animation runs, set by `stop()`."""
 
     def __rich_console__(
         self,
@@ -79,26 +103,36 @@ class CLIAnimation:
         options,
     ):
         """Rich will call this automatically when rendering."""
-        if not self.is_complete:
-            console.force_terminal = True
-            if console.is_terminal:
-                # force referesh
-                console._is_alt_screen = False
+        current_ns = time.monotonic_ns()
+        elapsed_ns = current_ns - self.state.start_ns
 
-        current_time = time.time()
         self.state.frame += 1
-        self.state.last_update = current_time
+        self.state.last_update = current_ns
 
-        yield from self.apply(console, options)
+        # `elapsed_ns` reads this for the rest of the frame
+        self.state.elapsed_ns = elapsed_ns
+        try:
+            yield from self.apply(console, options)
+        finally:
+            self.state.elapsed_ns = None
 
     def apply(self, console, options):
         """Used by subclasses to apply the animation."""
         yield self.renderable
 
+    @property
+    def elapsed_ns(self) -> int:
+        """Nanoseconds elapsed since the animation started, on the monotonic
+        clock."""
+        elapsed_ns = self.state.elapsed_ns
+        if elapsed_ns is None:
+            return time.monotonic_ns() - self.state.start_ns
+        return elapsed_ns
+
     @property
     def time_elapsed(self) -> float:
         """Time elapsed since the animation started."""
-        return time.time() - self.state.start_time
+        return self.elapsed_ns / 1_000_000_000
 
     @property
     def is_complete(self) -> bool:
@@ -107,9 +141,8 @@ class CLIAnimation:
             return False
         return self.time_elapsed >= self.duration
 
-    def animate(
+    def start(
         self,
-        duration: Optional[float] = None,
         refresh_rate: int = 20,
         transient: bool = True,
         auto_refresh: bool = True,
@@ -117,29 +150,113 @@ class CLIAnimation:
         screen: bool = False,
         vertical_overflow: str = "ellipsis",
     ) -> None:
-        """Animate this effect for the specified duration using Live."""
-        animate_duration = duration or self.duration or 3.0
-
-        # Use provided console or create new one
-        live_console = console or get_console()
+        """Start this effect on a background thread, running until `stop()`
+        is called."""
+        self._stop_animation = False
+        self._stop_event.clear()
+
+        # Use provided console or the one cached on init
+        console = console or self.rich_console
+        console.force_terminal = True
+        if console.is_terminal:
+            # force referesh
+            console._is_alt_screen = False
+
+        self._animation_thread = threading.Thread(
+            target=self._run_live,
+            kwargs={
+                "refresh_rate": refresh_rate,
+                "transient": transient,
+                "auto_refresh": auto_refresh,
+                "console": console,
+                "screen": screen,
+                "vertical_overflow": vertical_overflow,
+            },
+            daemon=True,
+        )
+        self._animation_thread.start()
 
+    def _run_live(
+        self,
+        refresh_rate: int,
+        transient: bool,
+        auto_refresh: bool,
+        console: "Console",
+        screen: bool,
+        vertical_overflow: str,
+    ) -> None:
+        """Runs the Live display on the animation thread until stopped."""
         with Live(
             self,
-            console=live_console,
+            console=console,
             refresh_per_second=refresh_rate,
             transient=transient,
             auto_refresh=auto_refresh,
             screen=screen,
             vertical_overflow=vertical_overflow,
         ) as live:
-            start = time.time()
-            while time.time() - start < animate_duration:
-                time.sleep(0.05)
+            if auto_refresh:
+                # `Live` redraws on its own refresh thread
+                self._stop_event.wait()
+            else:
+                while not self._stop_event.wait(1 / refresh_rate):
+                    live.refresh()
+
+    def animate(
+        self,
+        duration: Optional[float] = None,
+        refresh_rate: int = 20,
+        transient: bool = True,
+        auto_refresh: bool = True,
+        console: Optional["Console"] = None,
+        screen: bool = False,
+        vertical_overflow: str = "ellipsis",
+    ) -> None:
+        """Animate this effect for the specified duration using Live."""
+        animate_duration = duration or self.duration or 3.0
+
+        self.start(
+            refresh_rate=refresh_rate,
+            transient=transient,
+            auto_refresh=auto_refresh,
+            console=console,
+            screen=screen,
+            vertical_overflow=vertical_overflow,
+        )
+        try:
+            # Returns early if `stop()` is called from elsewhere
+            self._animation_thread.join(timeout=animate_duration)
+        finally:
+            self.stop()
+            self._animation_thread.join()
+
+    def stop(self) -> None:
+        """Stop a running animation before its duration runs out."""
+        self._stop_animation = True
+        self._stop_event.set()
+
+
+def _get_text(renderable) -> "str | Text":
+    """The text of a renderable that is colored as a whole."""
+    if isinstance(renderable, Text):
+        return renderable
+    return str(renderable)
+
+
+def _colored_text(text: "str | Text", style) -> Text:
+    """Color text as a whole, without parsing it as markup."""
+    if isinstance(text, Text):
+        result = Text(style=style)
+        result.append_text(text)
+        return result
+    return Text(text, style=style)
 
 
 class CLIFlashingAnimation(CLIAnimation):
     """Makes any renderable flash/blink."""
 
+    __slots__ = ("speed", "colors", "_styles", "_text", "_speed_ns")
+
     def __init__(
         self,
         renderable,
@@ -151,28 +268,54 @@ class CLIFlashingAnimation(CLIAnimation):
     ):
         super().__init__(renderable, duration)
         self.speed = speed
+        self._speed_ns = _to_ns(self.speed)
         # If colors is provided, use it; otherwise use on_color/off_color
         if colors is not None:
             self.colors = colors
         else:
             self.colors = [on_color, off_color]
+        self._styles = [Style.parse(color) for color in self.colors]
+        self._text = _get_text(renderable)
 
     def apply(self, console, options):
         # Calculate which color to use based on time
-        color_index = int(self.time_elapsed / self.speed) % len(self.colors)
-        color = self.colors[color_index]
+        color_index = (self.elapsed_ns // self._speed_ns) % len(self.colors)
 
         # Apply color to the renderable
-        if isinstance(self.renderable, str):
-            yield Text(self.renderable, style=color)
-        else:
-            # Wrap any renderable in the flash color
-            yield Text.from_markup(f"[{color}]{self.renderable}[/{color}]")
+        yield _colored_text(self._text, self._styles[color_index])
+
+
+_PULSE_STEPS = 128
+"""Number of samples taken over one period of a pulsing animation."""
+
+
+_GRAY_STYLES: List[Optional[Style]] = [None] * 256
+"""Styles for each gray from `rgb(0,0,0)` to `rgb(255,255,255)`, shared by
+all pulsing animations and filled on first use."""
+
+
+def _get_gray_style(rgb_value: int) -> Style:
+    """The style for a gray with equal RGB values."""
+    style = _GRAY_STYLES[rgb_value]
+    if style is None:
+        style = Style.parse(f"rgb({rgb_value},{rgb_value},{rgb_value})")
+        _GRAY_STYLES[rgb_value] = style
+    return style
 
 
 class CLIPulsingAnimation(CLIAnimation):
     """Makes any renderable pulse/breathe."""
 
+    __slots__ = (
+        "speed",
+        "min_opacity",
+        "max_opacity",
+        "color",
+        "_fade_styles",
+        "_fade_scale",
+        "_fade_panel",
+    )
+
     def __init__(
         self,
         renderable: "RenderableType",
@@ -188,45 +331,54 @@ class CLIPulsingAnimation(CLIAnimation):
         self.max_opacity = max_opacity
         self.color = color
 
-    def apply(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
-        # Calculate opacity using sine wave
-        opacity = self.min_opacity + (self.max_opacity - self.min_opacity) * (
-            0.5 + 0.5 * math.sin(self.time_elapsed * self.speed)
-        )
+        # One period of the sine wave, sampled once, as gray styles
+        self._fade_styles = [
+            _get_gray_style(
+                int(
+                    (
+                        min_opacity
+                        + (max_opacity - min_opacity)
+                        * (0.5 + 0.5 * math.sin(2 * math.pi * step / _PULSE_STEPS))
+                    )
+                    * 255
+                )
+            )
+            for step in range(_PULSE_STEPS)
+        ]
+        self._fade_scale = speed * _PULSE_STEPS / (2 * math.pi)
+
+        # The panel faded on each frame, built once and restyled per frame.
+        # Panels are copied so the caller's panel is left untouched, anything
+        # else is wrapped in a panel.
+        self._fade_panel: Panel | None = None
+        if isinstance(renderable, Panel):
+            self._fade_panel = copy.copy(renderable)
+        elif not isinstance(renderable, str):
+            self._fade_panel = Panel(renderable)
 
-        # Convert opacity to RGB values for fading effect
-        rgb_value = int(opacity * 255)
-        fade_color = f"rgb({rgb_value},{rgb_value},{rgb_value})"
+    def apply(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
+        # Look up the style for this point of the sine wave
+        fade_color = self._fade_styles[
+            int(self.time_elapsed * self._fade_scale) % _PULSE_STEPS
+        ]
 
-        if isinstance(self.renderable, str):
+        if self._fade_panel is None:
             yield Text(self.renderable, style=fade_color)
         else:
-            # For Panel and other renderables, we need to use opacity styling
-            if isinstance(self.renderable, Panel):
-                # Create a new panel with modified style
-                new_panel = Panel(
-                    self.renderable.renderable,
-                    title=self.renderable.title,
-                    title_align=self.renderable.title_align,
-                    subtitle=self.renderable.subtitle,
-                    subtitle_align=self.renderable.subtitle_align,
-                    box=self.renderable.box,
-                    style=fade_color,
-                    border_style=fade_color,
-                    expand=self.renderable.expand,
-                    padding=self.renderable.padding,
-                    width=self.renderable.width,
-                    height=self.renderable.height,
-                )
-                yield new_panel
-            else:
-                # For other renderables, wrap in a panel with the fade effect
-                yield Panel(self.renderable, style=fade_color, border_style=fade_color)
+            self._fade_panel.style = fade_color
+            self._fade_panel.border_style = fade_color
+            yield self._fade_panel
+
+
+_SHAKE_STEPS = 64
+"""Number of random offsets a shaking animation cycles through."""
 
 
 class CLIShakingAnimation(CLIAnimation):
     """Makes text shake/jitter."""
 
+    __slots__ = ("intensity", "speed", "last_shake", "_shakes", "_shake_index")
+
     def __init__(
         self,
         renderable: "RenderableType",
@@ -239,12 +391,20 @@ class CLIShakingAnimation(CLIAnimation):
         self.speed = speed
         self.last_shake = 0
 
+        # A random sequence of shake offsets, drawn once and cycled through
+        self._shakes = [
+            " " * offset
+            for offset in random.choices(range(intensity + 1), k=_SHAKE_STEPS)
+        ]
+        self._shake_index = 0
+
     def apply(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
         if self.time_elapsed - self.last_shake > self.speed:
             self.last_shake = self.time_elapsed
 
             # Add random spaces for shake effect
-            shake = " " * random.randint(0, self.intensity)
+            shake = self._shakes[self._shake_index % _SHAKE_STEPS]
+            self._shake_index += 1
 
             if isinstance(self.renderable, str):
                 yield Text(shake + self.renderable)
@@ -258,6 +418,16 @@ class CLIShakingAnimation(CLIAnimation):
 class CLITypingAnimation(CLIAnimation):
     """Typewriter effect."""
 
+    __slots__ = (
+        "text",
+        "speed",
+        "cursor",
+        "show_cursor",
+        "_speed_ns",
+        "_chars_shown",
+        "_frame_text",
+    )
+
     def __init__(
         self,
         text: str,
@@ -271,28 +441,40 @@ class CLITypingAnimation(CLIAnimation):
         self.text = text
         # Use typing_speed if provided, otherwise use speed
         self.speed = typing_speed if typing_speed is not None else speed
+        self._speed_ns = _to_ns(self.speed)
         self.cursor = cursor
         self.show_cursor = show_cursor
 
+        # Several frames render between each typed character, so the text
+        # for the current character count is kept and reused until it changes
+        self._chars_shown = -1
+        self._frame_text = Text()
+
     def apply(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
         # Calculate how many characters to show
-        chars_to_show = int(self.time_elapsed / self.speed)
+        chars_to_show = self.elapsed_ns // self._speed_ns
         chars_to_show = min(chars_to_show, len(self.text))
 
-        if chars_to_show < len(self.text):
-            # Still typing - show cursor if enabled
-            text_content = self.text[:chars_to_show]
-            if self.show_cursor:
-                text_content += self.cursor
-            yield Text(text_content)
-        else:
-            # Finished typing - show complete text without cursor
-            yield Text(self.text)
+        if chars_to_show != self._chars_shown:
+            self._chars_shown = chars_to_show
+            if chars_to_show < len(self.text):
+                # Still typing - show cursor if enabled
+                text_content = self.text[:chars_to_show]
+                if self.show_cursor:
+                    text_content += self.cursor
+                self._frame_text = Text(text_content)
+            else:
+                # Finished typing - show complete text without cursor
+                self._frame_text = Text(self.text)
+
+        yield self._frame_text
 
 
 class CLISpinningAnimation(CLIAnimation):
     """Spinner effect for any renderable."""
 
+    __slots__ = ("frames", "speed", "prefix", "_speed_ns")
+
     def __init__(
         self,
         renderable: "RenderableType",
@@ -304,10 +486,11 @@ class CLISpinningAnimation(CLIAnimation):
         super().__init__(renderable, duration)
         self.frames = frames or ["⋅", "•", "●", "◉", "●", "•"]
         self.speed = speed
+        self._speed_ns = _to_ns(self.speed)
         self.prefix = prefix
 
     def apply(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
-        frame_index = int(self.time_elapsed / self.speed) % len(self.frames)
+        frame_index = (self.elapsed_ns // self._speed_ns) % len(self.frames)
         spinner = self.frames[frame_index]
 
         if isinstance(self.renderable, str):
@@ -349,6 +532,8 @@ RAINBOW_PRESETS = {
 class CLIRainbowAnimation(CLIAnimation):
     """Rainbow color cycling effect."""
 
+    __slots__ = ("speed", "colors", "_styles", "_rainbow_texts", "_text", "_speed_ns")
+
     def __init__(
         self,
         renderable: "RenderableType",
@@ -358,6 +543,7 @@ class CLIRainbowAnimation(CLIAnimation):
     ):
         super().__init__(renderable, duration)
         self.speed = speed
+        self._speed_ns = _to_ns(self.speed)
 
         # Handle color selection
         if colors is None:
@@ -369,24 +555,54 @@ class CLIRainbowAnimation(CLIAnimation):
             self.colors = colors
         else:
             self.colors = RAINBOW_PRESETS["classic"]
+        self._styles = [Style.parse(color) for color in self.colors]
+
+        # Strings are colored per character, and only ever take one of
+        # `len(colors)` rotations of the palette, so each is built once, on
+        # the first frame that shows it
+        self._rainbow_texts: List[Optional[Text]] = [None] * len(self.colors)
+        self._text = _get_text(renderable)
+
+    def _get_rainbow_text(self, offset: int) -> Text:
+        """The renderable string with the palette rotated by `offset`."""
+        text = self._rainbow_texts[offset]
+        if text is None:
+            styles = self._styles
+            count = len(styles)
+            text = Text(
+                self.renderable,
+                spans=[
+                    Span(i, i + 1, styles[(offset + i) % count])
+                    for i in range(len(self.renderable))
+                ],
+            )
+            self._rainbow_texts[offset] = text
+        return text
 
     def apply(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
         if isinstance(self.renderable, str):
             # Apply rainbow to each character
-            result = Text()
-            for i, char in enumerate(self.renderable):
-                color_offset = int(
-                    (self.time_elapsed / self.speed + i) % len(self.colors)
-                )
-                color = self.colors[color_offset]
-                result.append(char, style=color)
-            yield result
+            offset = (self.elapsed_ns // self._speed_ns) % len(self.colors)
+            yield self._get_rainbow_text(offset)
         else:
             # Cycle through colors for the whole renderable
-            color_index = int(self.time_elapsed / self.speed) % len(self.colors)
-            yield Text.from_markup(
-                f"[{self.colors[color_index]}]{self.renderable}[/{self.colors[color_index]}]"
-            )
+            color_index = (self.elapsed_ns // self._speed_ns) % len(self.colors)
+            yield _colored_text(self._text, self._styles[color_index])
+
+
+def _run_animation(
+    animation_cls: type[CLIAnimation],
+    renderable: "RenderableType",
+    duration: Optional[float],
+    refresh_rate: int,
+    transient: bool,
+    **kwargs,
+) -> None:
+    """Creates an animation of the given class and runs it, shared by the
+    `animate_*` functions."""
+    animation_cls(renderable, duration=duration, **kwargs).animate(
+        duration=duration, refresh_rate=refresh_rate, transient=transient
+    )
 
 
 def animate_flashing(
@@ -413,14 +629,16 @@ def animate_flashing(
         >>> animate_flashing("Alert!", duration=3.0, speed=0.3)
         >>> animate_flashing(Panel("Warning"), on_color="red", off_color="dark_red")
     """
-    animation = CLIFlashingAnimation(
+    _run_animation(
+        CLIFlashingAnimation,
         renderable,
-        duration=duration,
+        duration,
+        refresh_rate,
+        transient,
         speed=speed,
         on_color=on_color,
         off_color=off_color,
     )
-    animation.animate(duration=duration, refresh_rate=refresh_rate)
 
 
 def animate_pulsing(
@@ -447,14 +665,16 @@ def animate_pulsing(
         >>> animate_pulsing("Loading...", duration=5.0, speed=2.0)
         >>> animate_pulsing(Panel("Status"), min_opacity=0.1, max_opacity=0.9)
     """
-    animation = CLIPulsingAnimation(
+    _run_animation(
+        CLIPulsingAnimation,
         renderable,
-        duration=duration,
+        duration,
+        refresh_rate,
+        transient,
         speed=speed,
         min_opacity=min_opacity,
         max_opacity=max_opacity,
     )
-    animation.animate(duration=duration, refresh_rate=refresh_rate)
 
 
 def animate_shaking(
@@ -479,10 +699,15 @@ def animate_shaking(
         >>> animate_shaking("Error!", duration=1.5, intensity=3)
         >>> animate_shaking(Panel("Critical Alert"), speed=15.0)
     """
-    animation = CLIShakingAnimation(
-        renderable, duration=duration, intensity=intensity, speed=speed
+    _run_animation(
+        CLIShakingAnimation,
+        renderable,
+        duration,
+        refresh_rate,
+        transient,
+        intensity=intensity,
+        speed=speed,
     )
-    animation.animate(duration=duration, refresh_rate=refresh_rate)
 
 
 def animate_spinning(
@@ -509,10 +734,16 @@ def animate_spinning(
         >>> animate_spinning("Processing...", duration=10.0, speed=0.2)
         >>> animate_spinning("Done", frames=["◐", "◓", "◑", "◒"], prefix=False)
     """
-    animation = CLISpinningAnimation(
-        renderable, duration=duration, frames=frames, speed=speed, prefix=prefix
+    _run_animation(
+        CLISpinningAnimation,
+        renderable,
+        duration,
+        refresh_rate,
+        transient,
+        frames=frames,
+        speed=speed,
+        prefix=prefix,
     )
-    animation.animate(duration=duration, refresh_rate=refresh_rate)
 
 
 def animate_rainbow(
@@ -535,8 +766,9 @@ def animate_rainbow(
         >>> animate_rainbow("Colorful Text!", duration=4.0, speed=1.0)
         >>> animate_rainbow(Panel("Rainbow Panel"), speed=0.3)
     """
-    animation = CLIRainbowAnimation(renderable, duration=duration, speed=speed)
-    animation.animate(duration=duration, refresh_rate=refresh_rate)
+    _run_animation(
+        CLIRainbowAnimation, renderable, duration, refresh_rate, transient, speed=speed
+    )
 
 
 def animate_typing(
@@ -563,11 +795,13 @@ def animate_typing(
         >>> animate_typing("Hello, World!", typing_speed=0.1)
         >>> animate_typing("Fast typing", duration=1.0, cursor="|", show_cursor=False)
     """
-    animation = CLITypingAnimation(
+    _run_animation(
+        CLITypingAnimation,
         text,
-        duration=duration,
+        duration,
+        refresh_rate,
+        transient,
         typing_speed=typing_speed,
         cursor=cursor,
         show_cursor=show_cursor,
     )
-    animation.animate(duration=duration, refresh_rate=refresh_rate)
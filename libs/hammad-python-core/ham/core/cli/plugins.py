@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import builtins
 import json
+import re
 from typing import (
     Optional,
     IO,
@@ -63,6 +64,10 @@ if TYPE_CHECKING:
 # Lazy import cache
 _IMPORT_CACHE = {}
 
+# Patterns for `rich_brackets`, compiled once rather than on every print
+_RICH_MARKUP_PATTERN = re.compile(r"\[/?[a-zA-Z][a-zA-Z0-9 _]*\]")
+_BRACKETED_TEXT_PATTERN = re.compile(r"\[([^\[\]]+)\]")
+
 
 def _get_rich_console():
     """Lazy import for rich.get_console"""
@@ -234,12 +239,10 @@ def print(
 
     # Apply automatic bracket tagging if enabled
     if rich_brackets:
-        import re
-
         # Skip processing if content already contains Rich markup patterns
-        if not re.search(r"\[/?[a-zA-Z][a-zA-Z0-9 _]*\]", content):
+        if not _RICH_MARKUP_PATTERN.search(content):
             # Replace [text] patterns with Rich markup [bold cyan]text[/bold cyan]
-            content = re.sub(r"\[([^\[\]]+)\]", r"[bold cyan]\1[/bold cyan]", content)
+            content = _BRACKETED_TEXT_PATTERN.sub(r"[bold cyan]\1[/bold cyan]", content)
 
     # Apply styling and background
     live_render, style_renderable = _get_style_utils()
@@ -74,8 +74,9 @@ def markdown_table_row(cells: List[str], is_header: bool = False) -> str:
 def markdown_blockquote(text: str, level: int = 1) -> str:
     """Format text as a blockquote in Markdown."""
     prefix = ">" * level + " "
-    lines = text.split("\n")
-    return "\n".join(f"{prefix}{line}" for line in lines)
+    # Prefix every line with a single replace, rather than splitting the
+    # text into a list of lines and joining them back together
+    return prefix + text.replace("\n", "\n" + prefix)
 
 
 def markdown_horizontal_rule() -> str:
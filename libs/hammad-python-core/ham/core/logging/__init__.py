@@ -9,6 +9,7 @@ if TYPE_CHECKING:
         get_logger,
         create_logger,
         create_logger_level,
+        LazyFormat,
         LoggerLevelName,
         LoggerLevelSettings,
     )
@@ -27,6 +28,7 @@ __all__ = (
     "get_logger",
     "create_logger",
     "create_logger_level",
+    "LazyFormat",
     "LoggerLevelName",
     "LoggerLevelSettings",
     # ham.core.logging.decorators
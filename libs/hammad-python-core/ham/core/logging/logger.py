@@ -1,11 +1,14 @@
 """ham.core.logging.logger"""
 
 import logging as _logging
-import inspect
+import re
+import sys
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import (
     Literal,
+    Tuple,
     TypeAlias,
     Dict,
     Optional,
@@ -19,6 +22,7 @@ from typing_extensions import TypedDict
 from contextlib import contextmanager
 
 from rich import get_console as get_rich_console
+from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import (
     Progress,
@@ -28,7 +32,10 @@ from rich.progress import (
     BarColumn,
     TimeRemainingColumn,
 )
+from rich.errors import MarkupError, StyleSyntaxError
 from rich.spinner import Spinner
+from rich.style import Style
+from rich.text import Text
 from rich.live import Live
 
 from ..cli.styles.types import (
@@ -46,6 +53,7 @@ __all__ = (
     "get_logger",
     "LoggerConfig",
     "FileConfig",
+    "LazyFormat",
 )
 
 
@@ -58,6 +66,19 @@ LoggerLevelName: TypeAlias = Literal["debug", "info", "warning", "error", "criti
 """Literal type helper for logging levels."""
 
 
+_LEVEL_VALUES: Dict[str, int] = {
+    "debug": _logging.DEBUG,
+    "info": _logging.INFO,
+    "warning": _logging.WARNING,
+    "error": _logging.ERROR,
+    "critical": _logging.CRITICAL,
+}
+"""Numeric values of the standard logging levels, by lowercase name."""
+
+_LEVEL_NAMES: Dict[int, str] = {value: name for name, value in _LEVEL_VALUES.items()}
+"""Lowercase names of the standard logging levels, by numeric value."""
+
+
 class LoggerLevelSettings(TypedDict, total=False):
     """Configuration dictionary for the display style of a
     single logging level."""
@@ -165,28 +186,109 @@ DEFAULT_LEVEL_STYLES: Dict[str, LoggerLevelSettings] = {
 
 
 # -----------------------------------------------------------------------------
-# Logging Filter
+# Lazy Messages
 # -----------------------------------------------------------------------------
 
 
-class RichLoggerFilter(_logging.Filter):
-    """Filter for applying rich styling to log messages based on level."""
+class LazyFormat:
+    """A `{}`-style log message that is only formatted if it is emitted.
 
-    def __init__(self, level_styles: Dict[str, LoggerLevelSettings]):
-        super().__init__()
-        self.level_styles = level_styles
+    Logging already defers `%`-style messages (`logger.info("got %s", n)`)
+    until a handler needs them, but f-strings and `str.format` calls run even
+    when the level is disabled. Wrap those in `LazyFormat` to defer them too:
+
+    ```python
+    logger.debug(LazyFormat("parsed {} rows from {!r}", count, path))
+    ```
+    """
 
-    def filter(self, record: _logging.LogRecord) -> bool:
-        # Get the level name
-        level_name = record.levelname.lower()
+    __slots__ = ("format_str", "args", "kwargs")
 
-        # Check if we have custom styling for this level
-        if level_name in self.level_styles:
-            style_config = self.level_styles[level_name]
+    def __init__(self, format_str: str, *args: Any, **kwargs: Any) -> None:
+        self.format_str = format_str
+        self.args = args
+        self.kwargs = kwargs
 
-            record._hammad_style_config = style_config
+    def __str__(self) -> str:
+        return self.format_str.format(*self.args, **self.kwargs)
 
-        return True
+    def __repr__(self) -> str:
+        return f"LazyFormat({self.format_str!r})"
+
+
+# -----------------------------------------------------------------------------
+# Console
+# -----------------------------------------------------------------------------
+
+
+_console: Optional[Console] = None
+"""The rich console shared by the handlers and formatters in this module."""
+
+
+def _get_console() -> Console:
+    """Get the shared rich console, resolving it on first use."""
+    global _console
+    if _console is None:
+        _console = get_rich_console()
+    return _console
+
+
+# -----------------------------------------------------------------------------
+# Style Markup
+# -----------------------------------------------------------------------------
+
+
+# Style attributes of `CLIStyleRenderableSettings` that map directly to a
+# rich markup tag, in the order they are written into the style string
+_RENDERABLE_STYLE_ATTRIBUTES = (
+    "bold",
+    "italic",
+    "dim",
+    "underline",
+    "strike",
+    "blink",
+    "blink2",
+    "reverse",
+    "conceal",
+    "underline2",
+    "frame",
+    "encircle",
+    "overline",
+)
+
+
+@lru_cache(maxsize=256)
+def _get_style_tags(style: str) -> Tuple[str, str]:
+    """Get the opening and closing rich markup tags for a style string."""
+    return f"[{style}]", f"[/{style}]"
+
+
+def _build_renderable_style_string(style_dict: dict) -> str:
+    """Build a rich markup style string from a CLIStyleRenderableSettings dictionary."""
+    return " ".join(
+        attr for attr in _RENDERABLE_STYLE_ATTRIBUTES if style_dict.get(attr)
+    )
+
+
+def _get_style_string(style: Any) -> Optional[str]:
+    """Get the rich style string for a style string tag or a
+    CLIStyleRenderableSettings dict, or None if it applies no style."""
+    if not style:
+        return None
+    if isinstance(style, str):
+        # It's a color/style string tag
+        return style
+    if isinstance(style, dict):
+        # It's a CLIStyleRenderableSettings dict
+        return _build_renderable_style_string(style) or None
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_markup(markup: str) -> Text:
+    """Parse a rich markup string, caching the result. The returned `Text`
+    is shared, so it must be copied (as `Text.assemble` does) before use."""
+    return Text.from_markup(markup)
 
 
 # -----------------------------------------------------------------------------
@@ -194,81 +296,149 @@ class RichLoggerFilter(_logging.Filter):
 # -----------------------------------------------------------------------------
 
 
+def _wrap_format_field(format_str: str, field_name: str, style: Optional[str]) -> str:
+    """Wrap every `{field_name}` replacement field of a `{`-style format
+    string in the markup tags for a style."""
+    if not style:
+        return format_str
+    open_tag, close_tag = (
+        tag.replace("{", "{{").replace("}", "}}") for tag in _get_style_tags(style)
+    )
+    return re.sub(
+        r"\{" + field_name + r"(?:![rsa])?(?::[^{}]*)?\}",
+        lambda match: f"{open_tag}{match.group(0)}{close_tag}",
+        format_str,
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_level_format(
+    format_str: str, title_style: Optional[str], message_style: Optional[str]
+) -> Tuple[str, Optional[str], Optional[Style]]:
+    """Compile a format string for one level into a
+    `(before, after, message_style)` triple. Cached, so handlers sharing a
+    format string and level styles (such as the defaults) compile it once.
+
+    When the format string has a single plain `{message}` field whose
+    surrounding markup parses on either side, the message is kept out of the
+    markup and styled with a parsed `Style` instead. Otherwise `after` is None
+    and `before` is the whole styled format string, parsed as markup."""
+    format_str = _wrap_format_field(format_str, "name", title_style)
+    before, sep, after = format_str.partition("{message}")
+    if sep and "{message" not in after:
+        try:
+            style = Style.parse(message_style) if message_style else None
+            Text.from_markup(before)
+            Text.from_markup(after)
+        except (StyleSyntaxError, MarkupError):
+            pass
+        else:
+            return before, after, style
+    return _wrap_format_field(format_str, "message", message_style), None, None
+
+
 class RichLoggerFormatter(_logging.Formatter):
-    """Custom formatter that applies rich styling."""
+    """Custom formatter that applies rich styling based on level.
+
+    Produces rich `Text` rather than a string, for `RichLoggerHandler`. The
+    format string is compiled once per level, with the message styled
+    directly instead of through markup, so user messages are never parsed as
+    markup and the markup around them is parsed once and cached."""
+
+    # `logging.Formatter` keeps a `__dict__`, but the attributes read for
+    # every record are given slots
+    __slots__ = ("level_styles", "_default_format", "_level_formats")
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        level_styles: Optional[Dict[str, LoggerLevelSettings]] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
-        self.console = get_rich_console()
+        self.set_level_styles(level_styles or {})
+
+    def set_level_styles(self, level_styles: Dict[str, LoggerLevelSettings]) -> None:
+        """Rebuild the per-level formats from a set of level styles."""
+        self.level_styles = level_styles
+        self._default_format = _compile_level_format(self._style._fmt, None, None)
+        self._level_formats = {}
+        for level_name, style_config in level_styles.items():
+            title_style = _get_style_string(style_config.get("title", None))
+            message_style = _get_style_string(style_config.get("message", None))
+            if title_style or message_style:
+                # Keyed on the upper-cased name, as used by `LogRecord.levelname`.
+                # Interned so lookups with logging's own (interned) level names
+                # match by identity.
+                self._level_formats[sys.intern(level_name.upper())] = (
+                    _compile_level_format(self._style._fmt, title_style, message_style)
+                )
+
+    def update_settings(
+        self,
+        level_styles: Dict[str, LoggerLevelSettings],
+        datefmt: Optional[str] = None,
+    ) -> None:
+        """Update the level styles and date format in place.
 
-    def formatMessage(self, record: _logging.LogRecord) -> str:
+        Lets a handler be reconfigured without re-creating the formatter and
+        re-parsing its format string."""
+        self.datefmt = datefmt
+        self.set_level_styles(level_styles)
+
+    @property
+    def console(self) -> Console:
+        """The rich console used by this formatter."""
+        return _get_console()
+
+    def formatMessage(self, record: _logging.LogRecord) -> Text:
         """Override formatMessage to apply styling to different parts."""
-        # Check if we have style configuration
-        if hasattr(record, "_hammad_style_config"):
-            style_config = record._hammad_style_config
-
-            # Handle title styling (logger name)
-            title_style = style_config.get("title", None)
-            if title_style:
-                if isinstance(title_style, str):
-                    # It's a color/style string tag
-                    record.name = f"[{title_style}]{record.name}[/{title_style}]"
-                elif isinstance(title_style, dict):
-                    # It's a CLIStyleRenderableSettings dict
-                    style_str = self._build_renderable_style_string(title_style)
-                    if style_str:
-                        record.name = f"[{style_str}]{record.name}[/{style_str}]"
-
-            # Handle message styling
-            message_style = style_config.get("message", None)
-            if message_style:
-                if isinstance(message_style, str):
-                    # It's a color/style string tag
-                    record.message = (
-                        f"[{message_style}]{record.getMessage()}[/{message_style}]"
-                    )
-                elif isinstance(message_style, dict):
-                    # It's a CLIStyleRenderableSettings dict
-                    style_str = self._build_renderable_style_string(message_style)
-                    if style_str:
-                        record.message = (
-                            f"[{style_str}]{record.getMessage()}[/{style_str}]"
-                        )
-                else:
-                    record.message = record.getMessage()
-            else:
-                record.message = record.getMessage()
-        else:
-            record.message = record.getMessage()
-
-        # Now format with the styled values
-        formatted = self._style._fmt.format(**record.__dict__)
-        return formatted if formatted != "None" else ""
-
-    def _build_renderable_style_string(self, style_dict: dict) -> str:
-        """Build a rich markup style string from a CLIStyleRenderableSettings dictionary."""
-        style_parts = []
-
-        # Handle all the style attributes from CLIStyleRenderableSettings
-        for attr in [
-            "bold",
-            "italic",
-            "dim",
-            "underline",
-            "strike",
-            "blink",
-            "blink2",
-            "reverse",
-            "conceal",
-            "underline2",
-            "frame",
-            "encircle",
-            "overline",
-        ]:
-            if style_dict.get(attr):
-                style_parts.append(attr)
-
-        return " ".join(style_parts) if style_parts else ""
+        record.message = record.getMessage()
+
+        # Use the compiled format for this level, if it has one
+        before, after, message_style = self._level_formats.get(
+            record.levelname, self._default_format
+        )
+        values = record.__dict__
+        if after is None:
+            return Text.from_markup(before.format_map(values))
+        if not after:
+            # Common case of a format ending in `{message}`, e.g. the default
+            return Text.assemble(
+                _parse_markup(before.format_map(values)),
+                Text(record.message, style=message_style or ""),
+            )
+        return Text.assemble(
+            _parse_markup(before.format_map(values)),
+            Text(record.message, style=message_style or ""),
+            _parse_markup(after.format_map(values)),
+        )
+
+
+# -----------------------------------------------------------------------------
+# Custom Rich Handler
+# -----------------------------------------------------------------------------
+
+
+class RichLoggerHandler(RichHandler):
+    """RichHandler that renders the prebuilt `Text` from RichLoggerFormatter
+    as-is, rather than parsing the formatted message as markup."""
+
+    def render_message(self, record: _logging.LogRecord, message: Any) -> Text:
+        if not isinstance(message, Text):
+            return super().render_message(record, message)
+
+        highlighter = getattr(record, "highlighter", self.highlighter)
+        if highlighter:
+            message = highlighter(message)
+
+        if self.keywords is None:
+            self.keywords = self.KEYWORDS
+
+        if self.keywords:
+            message.highlight_words(self.keywords, "logging.keyword")
+
+        return message
 
 
 # -----------------------------------------------------------------------------
@@ -289,6 +459,9 @@ class Logger:
     _custom_levels: Dict[str, int] = field(init=False)
     """Custom logging levels."""
 
+    _level_values: Dict[str, int] = field(init=False)
+    """Numeric values of the standard and custom levels, by name."""
+
     _user_level: str = field(init=False)
     """User-specified logging level."""
 
@@ -326,25 +499,21 @@ class Logger:
         """
         logger_name = name or "hammad"
 
-        # Initialize custom levels dict
+        # Initialize custom levels dict, and the lookup of every level's
+        # value by name (custom levels take precedence over standard ones)
         self._custom_levels = {}
+        self._level_values = dict(_LEVEL_VALUES)
 
         # Initialize level styles with defaults
-        self._level_styles = DEFAULT_LEVEL_STYLES.copy()
         if level_styles:
-            self._level_styles.update(level_styles)
+            self._level_styles = {**DEFAULT_LEVEL_STYLES, **level_styles}
+        else:
+            self._level_styles = DEFAULT_LEVEL_STYLES.copy()
 
         # Handle integer levels by converting to string names
         if isinstance(level, int):
             # Map standard logging levels to their names
-            int_to_name = {
-                _logging.DEBUG: "debug",
-                _logging.INFO: "info",
-                _logging.WARNING: "warning",
-                _logging.ERROR: "error",
-                _logging.CRITICAL: "critical",
-            }
-            level = int_to_name.get(level, "warning")
+            level = _LEVEL_NAMES.get(level, "warning")
 
         self._user_level = level or "warning"
 
@@ -353,20 +522,7 @@ class Logger:
         else:
             effective_level = self._user_level
 
-        # Standard level mapping
-        level_map = {
-            "debug": _logging.DEBUG,
-            "info": _logging.INFO,
-            "warning": _logging.WARNING,
-            "error": _logging.ERROR,
-            "critical": _logging.CRITICAL,
-        }
-
-        # Check if it's a custom level
-        if effective_level.lower() in self._custom_levels:
-            log_level = self._custom_levels[effective_level.lower()]
-        else:
-            log_level = level_map.get(effective_level.lower(), _logging.WARNING)
+        log_level = self._get_level_value(effective_level)
 
         # Create logger
         self._logger = _logging.getLogger(logger_name)
@@ -395,12 +551,16 @@ class Logger:
         self._logger.setLevel(log_level)
         self._logger.propagate = False
 
-    def _setup_handlers(self, log_level: int) -> None:
+    def _setup_handlers(
+        self,
+        log_level: int,
+        rich_formatter: Optional[RichLoggerFormatter] = None,
+    ) -> None:
         """Setup all handlers for the logger."""
         # Console handler
         if self._console_enabled:
             if self._rich_enabled:
-                self._setup_rich_handler(log_level)
+                self._setup_rich_handler(log_level, rich_formatter)
             else:
                 self._setup_standard_handler(log_level)
 
@@ -411,30 +571,41 @@ class Logger:
         for file_config in self._files_config:
             self._setup_file_handler(file_config, log_level)
 
-    def _setup_rich_handler(self, log_level: int) -> None:
-        """Setup rich handler for the logger."""
-        console = get_rich_console()
+    def _setup_rich_handler(
+        self,
+        log_level: int,
+        formatter: Optional[RichLoggerFormatter] = None,
+    ) -> None:
+        """Setup rich handler for the logger.
+
+        An existing formatter with the same format string is updated and
+        reused rather than created again."""
+        console = _get_console()
 
-        handler = RichHandler(
+        handler = RichLoggerHandler(
             level=log_level,
             console=console,
             rich_tracebacks=True,
             show_time=self._date_format is not None,
             show_path=False,
-            markup=True,
+            # RichLoggerFormatter builds the markup itself, messages are
+            # rendered as plain text
+            markup=False,
         )
 
         format_str = self._format or "| [bold]✼ {name}[/bold] - {message}"
-        formatter = RichLoggerFormatter(format_str, style="{")
+        if formatter is not None and formatter._fmt == format_str:
+            formatter.update_settings(self._level_styles, self._date_format)
+        else:
+            formatter = RichLoggerFormatter(
+                format_str, style="{", level_styles=self._level_styles
+            )
 
-        if self._date_format:
-            formatter.datefmt = self._date_format
+            if self._date_format:
+                formatter.datefmt = self._date_format
 
         handler.setFormatter(formatter)
 
-        # Add our custom filter
-        handler.addFilter(RichLoggerFilter(self._level_styles))
-
         self._logger.addHandler(handler)
 
     def _setup_standard_handler(self, log_level: int) -> None:
@@ -535,6 +706,10 @@ class Logger:
 
         return JSONFormatter()
 
+    def _get_level_value(self, level_name: str) -> int:
+        """Get the numeric value of a standard or custom level by name."""
+        return self._level_values.get(level_name.lower(), _logging.WARNING)
+
     def setLevel(
         self,
         level: Union[LoggerLevelName, int],
@@ -543,33 +718,13 @@ class Logger:
         # Handle integer levels by converting to string names
         if isinstance(level, int):
             # Map standard logging levels to their names
-            int_to_name = {
-                _logging.DEBUG: "debug",
-                _logging.INFO: "info",
-                _logging.WARNING: "warning",
-                _logging.ERROR: "error",
-                _logging.CRITICAL: "critical",
-            }
-            level_str = int_to_name.get(level, "warning")
+            level_str = _LEVEL_NAMES.get(level, "warning")
         else:
             level_str = level
 
         self._user_level = level_str
 
-        # Standard level mapping
-        level_map = {
-            "debug": _logging.DEBUG,
-            "info": _logging.INFO,
-            "warning": _logging.WARNING,
-            "error": _logging.ERROR,
-            "critical": _logging.CRITICAL,
-        }
-
-        # Check custom levels first
-        if level_str.lower() in self._custom_levels:
-            log_level = self._custom_levels[level_str.lower()]
-        else:
-            log_level = level_map.get(level_str.lower(), _logging.WARNING)
+        log_level = self._get_level_value(level_str)
 
         # Set the integer level on the logger and handlers
         self._logger.setLevel(log_level)
@@ -592,19 +747,16 @@ class Logger:
 
         # Store in our custom levels
         self._custom_levels[name.lower()] = value
+        self._level_values[name.lower()] = value
 
         # Add style if provided
         if style:
             self._level_styles[name.lower()] = style
 
-        # Update filters if using rich handler
+        # Update the level styles of any rich formatters
         for handler in self._logger.handlers:
-            if isinstance(handler, RichHandler):
-                # Remove old filter and add new one with updated styles
-                for f in handler.filters[:]:
-                    if isinstance(f, RichLoggerFilter):
-                        handler.removeFilter(f)
-                handler.addFilter(RichLoggerFilter(self._level_styles))
+            if isinstance(handler.formatter, RichLoggerFormatter):
+                handler.formatter.set_level_styles(self._level_styles)
 
     @property
     def level(self) -> str:
@@ -617,33 +769,13 @@ class Logger:
         # Handle integer levels by converting to string names
         if isinstance(value, int):
             # Map standard logging levels to their names
-            int_to_name = {
-                _logging.DEBUG: "debug",
-                _logging.INFO: "info",
-                _logging.WARNING: "warning",
-                _logging.ERROR: "error",
-                _logging.CRITICAL: "critical",
-            }
-            value_str = int_to_name.get(value, "warning")
+            value_str = _LEVEL_NAMES.get(value, "warning")
         else:
             value_str = value
 
         self._user_level = value_str
 
-        # Standard level mapping
-        level_map = {
-            "debug": _logging.DEBUG,
-            "info": _logging.INFO,
-            "warning": _logging.WARNING,
-            "error": _logging.ERROR,
-            "critical": _logging.CRITICAL,
-        }
-
-        # Check custom levels
-        if value_str.lower() in self._custom_levels:
-            log_level = self._custom_levels[value_str.lower()]
-        else:
-            log_level = level_map.get(value_str.lower(), _logging.WARNING)
+        log_level = self._get_level_value(value_str)
 
         # Update logger level
         self._logger.setLevel(log_level)
@@ -685,25 +817,12 @@ class Logger:
             *args: Additional positional arguments for the logger
             **kwargs: Additional keyword arguments for the logger
         """
-        # Standard level mapping
-        level_map = {
-            "debug": _logging.DEBUG,
-            "info": _logging.INFO,
-            "warning": _logging.WARNING,
-            "error": _logging.ERROR,
-            "critical": _logging.CRITICAL,
-        }
-
         # Handle integer levels
         if isinstance(level, int):
             # Use the integer level directly
             log_level = level
         else:
-            # Check custom levels first
-            if level.lower() in self._custom_levels:
-                log_level = self._custom_levels[level.lower()]
-            else:
-                log_level = level_map.get(level.lower(), _logging.WARNING)
+            log_level = self._get_level_value(level)
 
         self._logger.log(log_level, message, *args, **kwargs)
 
@@ -756,7 +875,7 @@ class Logger:
                 # do work
                 update("Still loading...")
         """
-        console = get_rich_console()
+        console = _get_console()
 
         if total is not None:
             # Use progress bar
@@ -852,14 +971,7 @@ class Logger:
         """
         handler_level = level or self._logger.level
         if isinstance(handler_level, str):
-            level_map = {
-                "debug": _logging.DEBUG,
-                "info": _logging.INFO,
-                "warning": _logging.WARNING,
-                "error": _logging.ERROR,
-                "critical": _logging.CRITICAL,
-            }
-            handler_level = level_map.get(handler_level.lower(), _logging.WARNING)
+            handler_level = self._get_level_value(handler_level)
 
         self._setup_file_handler(file_config, handler_level)
 
@@ -987,12 +1099,16 @@ def create_logger(
 
     Returns:
         A Logger instance with the specified configuration.
+
+    Messages are only formatted when a record is emitted, so pass arguments
+    separately (`logger.info("processed %s items", n)`) or wrap `{}`-style
+    messages in `LazyFormat` rather than building f-strings at the call site.
     """
     if name is None:
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            name = frame.f_back.f_code.co_name
-        else:
+        # Only look up the caller's frame when no name was given
+        try:
+            name = sys._getframe(1).f_code.co_name
+        except ValueError:
             name = "logger"
 
     return Logger(
@@ -1116,14 +1232,7 @@ def _get_log_level(level: Union[LoggerLevelName, int]) -> int:
     if isinstance(level, int):
         return level
 
-    level_map = {
-        "debug": _logging.DEBUG,
-        "info": _logging.INFO,
-        "warning": _logging.WARNING,
-        "error": _logging.ERROR,
-        "critical": _logging.CRITICAL,
-    }
-    return level_map.get(level.lower(), _logging.WARNING)
+    return _LEVEL_VALUES.get(level.lower(), _logging.WARNING)
 
 
 def _apply_level_to_children(parent_name: str, level: int) -> None:
@@ -1149,6 +1258,16 @@ def _wrap_logger_with_styling(
     handlers: Optional[List[_logging.Handler]] = None,
 ) -> None:
     """Apply rich styling wrapper to an existing logger."""
+    # Keep the formatter of an existing rich handler, so re-wrapping only
+    # updates its settings
+    rich_formatter = None
+    for handler in logger.handlers:
+        if isinstance(handler, RichLoggerHandler) and isinstance(
+            handler.formatter, RichLoggerFormatter
+        ):
+            rich_formatter = handler.formatter
+            break
+
     # Clear existing handlers to avoid duplicates
     if logger.hasHandlers():
         logger.handlers.clear()
@@ -1158,6 +1277,7 @@ def _wrap_logger_with_styling(
     temp_logger._logger = logger
     temp_logger._level_styles = level_styles or DEFAULT_LEVEL_STYLES
     temp_logger._custom_levels = {}
+    temp_logger._level_values = dict(_LEVEL_VALUES)
     temp_logger._file_config = file
     temp_logger._files_config = files or []
     temp_logger._format = format
@@ -1167,7 +1287,7 @@ def _wrap_logger_with_styling(
     temp_logger._rich_enabled = rich
 
     # Setup handlers using existing methods
-    temp_logger._setup_handlers(logger.level)
+    temp_logger._setup_handlers(logger.level, rich_formatter)
 
     # Add custom handlers if provided
     if handlers:
@@ -472,6 +472,71 @@ def field(
     return msgspec_field_instance
 
 
+# Keyword defaults of `field`, used by the typed helpers below to forward only
+# the constraints that were actually set
+_FIELD_DEFAULTS = field.__kwdefaults__
+
+
+def _set_constraints(kwargs: Dict[str, Any], **constraints: Any) -> Dict[str, Any]:
+    """Add the constraints that differ from `field`'s defaults to kwargs."""
+    for name, value in constraints.items():
+        if value is not _FIELD_DEFAULTS[name]:
+            kwargs[name] = value
+    return kwargs
+
+
+# Argument types whose equality implies identical values once the exact type
+# is matched (classes, such as a `default_factory` of `list`, compare by
+# identity). Floats, decimals and containers are left out, as equal values
+# such as `0.0` and `-0.0` or `(1, 2)` and `(True, 2)` differ.
+_SHAREABLE_VALUE_TYPES = frozenset({type(None), bool, int, str, bytes, type})
+
+
+def _get_shared_field(kwargs: Dict[str, Any]) -> Any:
+    """Return a `field(**kwargs)`, shared between identical calls.
+
+    The fields built by `field` are immutable, so the typed helpers below
+    hand out one instance per distinct set of arguments, as long as every
+    value is one of `_SHAREABLE_VALUE_TYPES`. Values are keyed alongside
+    their exact type so that `1` and `True` stay distinct."""
+    for value in kwargs.values():
+        if type(value) not in _SHAREABLE_VALUE_TYPES:
+            return field(**kwargs)
+    key = tuple((name, type(value), value) for name, value in sorted(kwargs.items()))
+    return _create_shared_field(key)
+
+
+@lru_cache(maxsize=512)
+def _create_shared_field(key: tuple) -> Any:
+    """Memoized `field` keyed on `_get_shared_field`'s argument key."""
+    return field(**{name: value for name, _, value in key})
+
+
+def _set_numeric_constraints(
+    kwargs: Dict[str, Any],
+    gt: Optional[Union[int, float]],
+    ge: Optional[Union[int, float]],
+    lt: Optional[Union[int, float]],
+    le: Optional[Union[int, float]],
+    multiple_of: Optional[Union[int, float]],
+) -> Dict[str, Any]:
+    """Add the numeric bounds that were set to kwargs.
+
+    Spelled out rather than going through `_set_constraints`, as the numeric
+    helpers are the ones called in bulk when generating many schemas."""
+    if gt is not None:
+        kwargs["gt"] = gt
+    if ge is not None:
+        kwargs["ge"] = ge
+    if lt is not None:
+        kwargs["lt"] = lt
+    if le is not None:
+        kwargs["le"] = le
+    if multiple_of is not None:
+        kwargs["multiple_of"] = multiple_of
+    return kwargs
+
+
 def str_field(
     *,
     min_length: Optional[int] = None,
@@ -483,14 +548,16 @@ def str_field(
     **kwargs,
 ) -> Any:
     """Create a string field with common string-specific options."""
-    return field(
-        min_length=min_length,
-        max_length=max_length,
-        pattern=pattern,
-        strip_whitespace=strip_whitespace,
-        to_lower=to_lower,
-        to_upper=to_upper,
-        **kwargs,
+    return _get_shared_field(
+        _set_constraints(
+            kwargs,
+            min_length=min_length,
+            max_length=max_length,
+            pattern=pattern,
+            strip_whitespace=strip_whitespace,
+            to_lower=to_lower,
+            to_upper=to_upper,
+        )
     )
 
 
@@ -504,7 +571,9 @@ def int_field(
     **kwargs,
 ) -> Any:
     """Create an integer field with numeric constraints."""
-    return field(gt=gt, ge=ge, lt=lt, le=le, multiple_of=multiple_of, **kwargs)
+    return _get_shared_field(
+        _set_numeric_constraints(kwargs, gt, ge, lt, le, multiple_of)
+    )
 
 
 def float_field(
@@ -518,15 +587,10 @@ def float_field(
     **kwargs,
 ) -> Any:
     """Create a float field with numeric constraints."""
-    return field(
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        multiple_of=multiple_of,
-        allow_inf_nan=allow_inf_nan,
-        **kwargs,
-    )
+    _set_numeric_constraints(kwargs, gt, ge, lt, le, multiple_of)
+    if not allow_inf_nan:
+        kwargs["allow_inf_nan"] = False
+    return _get_shared_field(kwargs)
 
 
 def list_field(
@@ -537,10 +601,16 @@ def list_field(
     **kwargs,
 ) -> Any:
     """Create a list field with collection constraints."""
-    return field(
-        default_factory=list,
-        min_length=min_length,
-        max_length=max_length,
-        unique_items=unique_items,
-        **kwargs,
+    if "default_factory" in kwargs:
+        raise TypeError(
+            "list_field() got multiple values for keyword argument 'default_factory'"
+        )
+    kwargs["default_factory"] = list
+    return _get_shared_field(
+        _set_constraints(
+            kwargs,
+            min_length=min_length,
+            max_length=max_length,
+            unique_items=unique_items,
+        )
     )
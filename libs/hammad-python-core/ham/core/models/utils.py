@@ -1,16 +1,20 @@
 """hammad.core.models.utils"""
 
 from functools import lru_cache
-from typing import Any, Callable, Optional, Union, Tuple, Dict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, Tuple, Dict
 
-from msgspec.structs import Struct
+from msgspec import field as msgspec_field
 
 from .fields import FieldInfo, field, Field
 from .model import Model
 
+if TYPE_CHECKING:
+    from msgspec.structs import Struct
+
 
 __all__ = (
     "create_model",
+    "make_model_factory",
     "get_field_info",
     "is_field",
     "is_model",
@@ -18,6 +22,26 @@ __all__ = (
 )
 
 
+# `msgspec.structs.Struct`, imported on first use by `_get_struct`
+_Struct = None
+
+
+def _get_struct() -> type["Struct"]:
+    """Lazy import for msgspec.structs.Struct"""
+    global _Struct
+    if _Struct is None:
+        from msgspec.structs import Struct
+
+        _Struct = Struct
+    return _Struct
+
+
+# Field descriptor types accepted as the second item of a `(type, field)`
+# definition. `field()` returns msgspec's own field type, which msgspec
+# does not export, so it is taken from a sample instance.
+_FIELD_DESCRIPTOR_TYPES = (Field, FieldInfo, type(msgspec_field()))
+
+
 def create_model(
     __model_name: str,
     *,
@@ -34,6 +58,10 @@ def create_model(
     This function provides a drop-in replacement for pydantic.create_model()
     that creates Model classes instead of pydantic BaseModel classes.
 
+    Classes are cached on their full definition, so calling this again with
+    the same name, bases and (hashable) field definitions returns the class
+    that was already built rather than creating a new one.
+
     Args:
         __model_name: Name of the model class to create
         __base__: Base class(es) to inherit from. If None, uses Model.
@@ -78,144 +106,325 @@ def create_model(
                                 email=str,
                                 __base__=BaseEntity)
     """
+    bases = _resolve_bases(__base__, __config__)
+
+    # Reuse the class built for an identical definition when every part of
+    # it is hashable (validators are an unhashable dict, so never cached)
+    if not __validators__:
+        definitions_key = _get_field_definitions_key(field_definitions)
+        if definitions_key is not None:
+            return _create_model_cached(
+                __model_name,
+                bases,
+                __module__,
+                __qualname__,
+                __doc__,
+                definitions_key,
+            )
+
+    return _build_model(
+        __model_name,
+        bases,
+        __module__,
+        __qualname__,
+        __doc__,
+        __validators__,
+        field_definitions,
+    )
+
+
+def make_model_factory(
+    *,
+    __base__: Optional[Union[type, Tuple[type, ...]]] = None,
+    __doc__: Optional[str] = None,
+    __validators__: Optional[Dict[str, Any]] = None,
+    __config__: Optional[type] = None,
+    **field_definitions: Any,
+) -> Callable[..., type[Model]]:
+    """Parse a set of field definitions once and return a factory that
+    creates a new Model class from them on every call.
+
+    Accepts the same arguments as `create_model` (other than the name,
+    module and qualname, which are given to the factory instead). Useful
+    when many models share one schema and only differ by name, as the
+    field definitions are not re-parsed for each class.
+
+    Args:
+        __base__: Base class(es) to inherit from. If None, uses Model.
+        __doc__: Docstring for the created classes
+        __validators__: Dictionary of validators (for compatibility)
+        __config__: Configuration class (for compatibility)
+        **field_definitions: Field definitions, as in `create_model`.
+
+    Returns:
+        A callable taking `(name, module=None, qualname=None)` that returns
+        a new Model class.
+
+    Examples:
+        make_user = make_model_factory(name=str, age=(int, 0))
+        Admin = make_user('Admin')
+        Guest = make_user('Guest', module=__name__)
+    """
+    bases = _resolve_bases(__base__, __config__)
+    template = _build_model_namespace(__doc__, __validators__, field_definitions)
+
+    def factory(
+        name: str,
+        module: Optional[str] = None,
+        qualname: Optional[str] = None,
+    ) -> type[Model]:
+        # Copy the mutable values (`__annotations__`, `_validators`) as well,
+        # so classes from the same factory never share them
+        class_dict = {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in template.items()
+        }
+        if module is not None:
+            class_dict["__module__"] = module
+        if qualname is not None:
+            class_dict["__qualname__"] = qualname
+        try:
+            return type(name, bases, class_dict)
+        except Exception as e:
+            raise ValueError(f"Failed to create model '{name}': {e}") from e
+
+    return factory
+
+
+def _resolve_bases(
+    base: Optional[Union[type, Tuple[type, ...]]],
+    config: Optional[type],
+) -> Tuple[type, ...]:
+    """Validate a `__base__` argument and normalize it to a tuple."""
     # Handle base class specification
-    if __base__ is not None and __config__ is not None:
+    if base is not None and config is not None:
         raise ValueError(
             "Cannot specify both '__base__' and '__config__' - "
             "use a base class with the desired configuration instead"
         )
 
     # Determine base classes
-    if __base__ is None:
-        bases = (Model,)
-    elif isinstance(__base__, tuple):
+    if base is None:
+        return (Model,)
+    Struct = _get_struct()
+    if isinstance(base, tuple):
         # Ensure all bases are compatible
-        for base in __base__:
-            if not (issubclass(base, Model) or issubclass(base, Struct)):
+        for b in base:
+            if not (issubclass(b, Model) or issubclass(b, Struct)):
                 raise ValueError(
-                    f"Base class {base} must be a subclass of Model or msgspec.Struct"
+                    f"Base class {b} must be a subclass of Model or msgspec.Struct"
                 )
-        bases = __base__
-    else:
-        if not (issubclass(__base__, Model) or issubclass(__base__, Struct)):
-            raise ValueError(
-                f"Base class {__base__} must be a subclass of Model or msgspec.Struct"
-            )
-        bases = (__base__,)
+        return base
+    if not (issubclass(base, Model) or issubclass(base, Struct)):
+        raise ValueError(
+            f"Base class {base} must be a subclass of Model or msgspec.Struct"
+        )
+    return (base,)
+
+
+# Default value types whose equality implies identical values once the
+# exact type is matched. Floats, decimals and containers are left out, as
+# equal values such as `0.0` and `-0.0` or `(1, 2)` and `(True, 2)` differ.
+_CACHEABLE_DEFAULT_TYPES = frozenset({type(None), bool, int, str, bytes})
+
 
+def _get_field_definitions_key(
+    field_definitions: Dict[str, Any],
+) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    """Build a hashable cache key for a set of field definitions, or
+    return None if any definition cannot be cached.
+
+    Default values are keyed alongside their exact type so that equal but
+    distinct defaults (such as `1` and `True`) do not share a class, and
+    only scalar defaults listed in `_CACHEABLE_DEFAULT_TYPES` are cached."""
+    key = []
+    for field_name, field_definition in field_definitions.items():
+        if isinstance(field_definition, tuple) and len(field_definition) == 2:
+            field_type, field_value = field_definition
+            if type(field_value) not in _CACHEABLE_DEFAULT_TYPES:
+                return None
+            key.append((field_name, field_type, type(field_value), field_value))
+        else:
+            key.append((field_name, type(field_definition), field_definition))
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@lru_cache(maxsize=256)
+def _create_model_cached(
+    model_name: str,
+    bases: Tuple[type, ...],
+    module: Optional[str],
+    qualname: Optional[str],
+    doc: Optional[str],
+    definitions_key: Tuple[Tuple[Any, ...], ...],
+) -> type[Model]:
+    """Memoized `_build_model` keyed on a model's full field signature."""
+    field_definitions = {}
+    for entry in definitions_key:
+        if len(entry) == 4:
+            field_definitions[entry[0]] = (entry[1], entry[3])
+        else:
+            field_definitions[entry[0]] = entry[2]
+    return _build_model(
+        model_name, bases, module, qualname, doc, None, field_definitions
+    )
+
+
+def _build_model(
+    model_name: str,
+    bases: Tuple[type, ...],
+    module: Optional[str],
+    qualname: Optional[str],
+    doc: Optional[str],
+    validators: Optional[Dict[str, Any]],
+    field_definitions: Dict[str, Any],
+) -> type[Model]:
+    """Parse field definitions and create the model class."""
+    class_dict = _build_model_namespace(doc, validators, field_definitions)
+    if module is not None:
+        class_dict["__module__"] = module
+    if qualname is not None:
+        class_dict["__qualname__"] = qualname
+
+    # Create the dynamic class
+    try:
+        DynamicModel = type(model_name, bases, class_dict)
+    except Exception as e:
+        raise ValueError(f"Failed to create model '{model_name}': {e}") from e
+
+    return DynamicModel
+
+
+def _build_model_namespace(
+    doc: Optional[str],
+    validators: Optional[Dict[str, Any]],
+    field_definitions: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Parse field definitions into the class dictionary of a model."""
     # Build class dictionary
     class_dict = {}
-    annotations = {}
 
     # Set metadata
-    if __doc__ is not None:
-        class_dict["__doc__"] = __doc__
-    if __module__ is not None:
-        class_dict["__module__"] = __module__
-    if __qualname__ is not None:
-        class_dict["__qualname__"] = __qualname__
-
-    # Process field definitions in two passes to ensure proper ordering
-    # First pass: collect required and optional fields separately
-    required_fields = {}
-    optional_fields = {}
+    if doc is not None:
+        class_dict["__doc__"] = doc
+
+    # Process field definitions in a single ordered walk, collecting the
+    # annotations of required and optional fields separately so that
+    # required fields can be placed first (msgspec requires this ordering)
+    required_annotations = {}
+    optional_annotations = {}
+    optional_values = []
 
     for field_name, field_definition in field_definitions.items():
-        if field_name.startswith("__") and field_name.endswith("__"):
-            # Skip special attributes that were passed as field definitions
+        # Skip special attributes that were passed as field definitions.
+        # Dunders are rare, so most names only pay the single-character check.
+        if field_name[:1] == "_" and field_name[:2] == "__" == field_name[-2:]:
             continue
 
         # Parse field definition
-        is_optional = False
-
-        if isinstance(field_definition, tuple):
-            if len(field_definition) == 2:
-                field_type, field_value = field_definition
-                annotations[field_name] = field_type
+        match field_definition:
+            case tuple((field_type, field_value)):
+                optional_annotations[field_name] = field_type
 
                 # Check if field_value is a Field instance or field
-                if hasattr(field_value, "__class__") and (
-                    "field" in field_value.__class__.__name__.lower()
-                    or hasattr(field_value, "default")
-                    or callable(getattr(field_value, "__call__", None))
+                if isinstance(field_value, _FIELD_DESCRIPTOR_TYPES) or hasattr(
+                    field_value, "_field_info"
                 ):
                     # It's a field descriptor
-                    optional_fields[field_name] = field_value
+                    optional_values.append(field_value)
                 else:
                     # It's a default value - create a field with this default
-                    optional_fields[field_name] = field(default=field_value)
-                is_optional = True
-            else:
+                    optional_values.append(field(default=field_value))
+            case tuple():
                 raise ValueError(
                     f"Field definition for '{field_name}' must be a 2-tuple of (type, default/Field)"
                 )
-        elif hasattr(field_definition, "__origin__") or hasattr(
-            field_definition, "__class__"
-        ):
-            # It's a type annotation (like str, int, List[str], etc.) - required field
-            annotations[field_name] = field_definition
-            required_fields[field_name] = None
-        else:
-            # It's likely a default value without type annotation
-            # We'll infer the type from the value
-            annotations[field_name] = type(field_definition)
-            optional_fields[field_name] = field(default=field_definition)
-            is_optional = True
+            case _:
+                # It's a type annotation (like str, int, List[str], etc.) - required field
+                required_annotations[field_name] = field_definition
 
-    # Second pass: add fields in correct order (required first, then optional)
-    # This ensures msgspec field ordering requirements are met
-    for field_name, field_value in required_fields.items():
-        if field_value is not None:
-            class_dict[field_name] = field_value
+    # Add optional field values, and annotations in the proper order
+    # (required fields first, then optional)
+    class_dict.update(zip(optional_annotations, optional_values))
 
-    for field_name, field_value in optional_fields.items():
-        class_dict[field_name] = field_value
+    if required_annotations:
+        required_annotations.update(optional_annotations)
+        class_dict["__annotations__"] = required_annotations
+    else:
+        # Only optional fields, so they are already in order
+        class_dict["__annotations__"] = optional_annotations
 
-    # Set annotations in proper order (required fields first, then optional)
-    ordered_annotations = {}
+    # Handle validators (basic implementation for compatibility)
+    if validators:
+        # Store validators for potential future use, along with the settings
+        # from `@validator` unpacked into slotted records
+        class_dict["_validators"] = dict(validators)
+        class_dict["_validator_info"] = {
+            name: _ValidatorInfo(func) for name, func in validators.items()
+        }
+        # Note: Full validator implementation would require more complex integration
 
-    # Add required field annotations first
-    for field_name in required_fields:
-        if field_name in annotations:
-            ordered_annotations[field_name] = annotations[field_name]
+    return class_dict
 
-    # Add optional field annotations second
-    for field_name in optional_fields:
-        if field_name in annotations:
-            ordered_annotations[field_name] = annotations[field_name]
 
-    class_dict["__annotations__"] = ordered_annotations
+class _ValidatorInfo:
+    """A validator function passed to `create_model`, along with the
+    settings recorded on it by `validator`."""
 
-    # Handle validators (basic implementation for compatibility)
-    if __validators__:
-        # Store validators for potential future use
-        class_dict["_validators"] = __validators__
-        # Note: Full validator implementation would require more complex integration
+    __slots__ = ("func", "fields", "pre", "post", "always")
 
-    # Create the dynamic class
-    try:
-        DynamicModel = type(__model_name, bases, class_dict)
-    except Exception as e:
-        raise ValueError(f"Failed to create model '{__model_name}': {e}") from e
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        self.fields = getattr(func, "_validator_fields", ())
+        self.pre = getattr(func, "_validator_pre", False)
+        self.post = getattr(func, "_validator_post", False)
+        self.always = getattr(func, "_validator_always", False)
 
-    return DynamicModel
+    def __repr__(self) -> str:
+        return f"_ValidatorInfo({self.func!r}, fields={self.fields!r})"
+
+
+# Sentinel for attribute probes in `get_field_info`
+_MISSING = object()
+
+
+def _get_tuple_field_info(field: tuple) -> Optional[FieldInfo]:
+    """Extract FieldInfo from a `(type, FieldInfo)` definition."""
+    if len(field) == 2 and isinstance(field[1], FieldInfo):
+        return field[1]
+    return None
+
+
+# Exact-type handlers for `get_field_info`, so the common field objects
+# resolve in a single dict lookup
+_FIELD_INFO_HANDLERS: Dict[type, Callable[[Any], Optional[FieldInfo]]] = {
+    Field: lambda field: field.field_info,
+    tuple: _get_tuple_field_info,
+}
 
 
 @lru_cache(maxsize=None)
 def get_field_info(field: Any) -> Optional[FieldInfo]:
     """Extract FieldInfo from a field descriptor with caching."""
-    if isinstance(field, tuple) and len(field) == 2:
-        _, field_info = field
-        if isinstance(field_info, FieldInfo):
-            return field_info
-    elif hasattr(field, "_field_info"):
-        return field._field_info
-    elif hasattr(field, "field_info"):
-        return field.field_info
-    elif isinstance(field, Field):
-        return field.field_info
-    elif hasattr(field, "__class__") and field.__class__.__name__ == "FieldDescriptor":
-        return field.field_info
+    handler = _FIELD_INFO_HANDLERS.get(type(field))
+    if handler is not None:
+        return handler(field)
+
+    # Subclasses and other descriptors (such as `FieldDescriptor`) expose
+    # their info as an attribute
+    field_info = getattr(field, "_field_info", _MISSING)
+    if field_info is not _MISSING:
+        return field_info
+    field_info = getattr(field, "field_info", _MISSING)
+    if field_info is not _MISSING:
+        return field_info
+    if isinstance(field, tuple):
+        return _get_tuple_field_info(field)
     return None
 
 
@@ -231,26 +440,34 @@ def is_model(model: Any) -> bool:
         return True
 
     # Check if it's a Model class (not instance)
-    if isinstance(model, type) and issubclass(model, Model):
+    if isinstance(model, type):
+        return _is_model_type(model, False)
+
+    # Duck typing only looks at class-level attributes and methods, so the
+    # result is cached per type instead of re-probed for every instance
+    return _is_model_type(type(model), True)
+
+
+@lru_cache(maxsize=512)
+def _is_model_type(cls: type, instance: bool) -> bool:
+    """Check if a class (or instances of it, when `instance` is set) is a
+    model, using duck typing for Model/msgspec.Struct lookalikes."""
+    if issubclass(cls, Model):
         return True
 
-    # Check for Model characteristics using duck typing
     # Look for key Model/msgspec.Struct attributes and methods
-    if hasattr(model, "__struct_fields__") and hasattr(model, "model_dump"):
+    if hasattr(cls, "__struct_fields__") and hasattr(cls, "model_dump"):
         # Check for Model-specific methods
         if (
-            hasattr(model, "model_copy")
-            and hasattr(model, "model_validate")
-            and hasattr(model, "model_to_pydantic")
+            hasattr(cls, "model_copy")
+            and hasattr(cls, "model_validate")
+            and hasattr(cls, "model_to_pydantic")
         ):
             return True
 
-    # Check if it's an instance of any msgspec Struct with Model methods
-    try:
-        if isinstance(model, Struct) and hasattr(model, "model_dump"):
+        # Check if it's an instance of any msgspec Struct with Model methods
+        if instance and issubclass(cls, _get_struct()):
             return True
-    except ImportError:
-        pass
 
     return False
 
@@ -269,6 +486,15 @@ def validator(
     Returns:
         Decorator function
     """
+    return _make_validator_decorator(fields, pre, post, always)
+
+
+@lru_cache(maxsize=None)
+def _make_validator_decorator(
+    fields: Tuple[str, ...], pre: bool, post: bool, always: bool
+) -> Callable[[Callable], Callable]:
+    """Build the `validator` decorator for a signature. The decorator only
+    tags the function, so one instance is shared per signature."""
 
     def decorator(func: Callable) -> Callable:
         func._validator_fields = fields
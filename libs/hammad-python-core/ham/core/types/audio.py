@@ -1,11 +1,17 @@
 """ham.core.types.multimodal.audio"""
 
-import httpx
-import mimetypes
+import os
+import stat
 from pathlib import Path
 from typing import Self
 
-from .file import File, FileSource, _FILE_SIGNATURES
+from .file import (
+    File,
+    FileSource,
+    _detect_signature,
+    _get_http_client,
+    _mime_for_path,
+)
 from ..models.fields import field
 
 
@@ -77,20 +83,20 @@ class Audio(File):
         type = None
 
         if not lazy:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
+            client = _get_http_client()
+            response = client.get(url, timeout=timeout)
+            response.raise_for_status()
 
-                data = response.content
-                size = len(data)
+            data = response.content
+            size = len(data)
 
-                # Get content type
-                content_type = response.headers.get("content-type", "")
-                type = content_type.split(";")[0] if content_type else None
+            # Get content type
+            content_type = response.headers.get("content-type", "")
+            type = content_type.split(";")[0] if content_type else None
 
-                # Validate it's audio
-                if type and not type.startswith("audio/"):
-                    raise ValueError(f"URL does not point to an audio file: {type}")
+            # Validate it's audio
+            if type and not type.startswith("audio/"):
+                raise ValueError(f"URL does not point to an audio file: {type}")
 
         return cls(
             data=data,
@@ -121,10 +127,13 @@ class Audio(File):
         """
         path_obj = Path(path)
 
-        if not path_obj.exists():
-            raise FileNotFoundError(f"Audio file not found: {path}")
+        # A single stat call covers both the existence and file checks
+        try:
+            st = os.stat(path_obj)
+        except OSError:
+            raise FileNotFoundError(f"Audio file not found: {path}") from None
 
-        if not path_obj.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {path}")
 
         # Read file data
@@ -134,14 +143,13 @@ class Audio(File):
         type = None
 
         # Check file signature first
-        for signature, mime_type in _FILE_SIGNATURES.items():
-            if data.startswith(signature) and mime_type.startswith("audio/"):
-                type = mime_type
-                break
+        mime_type = _detect_signature(data)
+        if mime_type and mime_type.startswith("audio/"):
+            type = mime_type
 
-        # Fall back to mimetypes module
+        # Fall back to the extension
         if not type:
-            type, _ = mimetypes.guess_type(str(path))
+            type = _mime_for_path(path_obj.name)
 
         # Validate it's an audio file
         if type and not type.startswith("audio/"):
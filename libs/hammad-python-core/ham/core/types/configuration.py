@@ -4,11 +4,10 @@ import os
 import configparser
 from pathlib import Path
 from typing import Any, Self
-import httpx
 import msgspec
 import yaml
 
-from ..types.file import File, FileSource
+from ..types.file import File, FileSource, _get_http_client
 from ..models.fields import field
 
 __all__ = ("Configuration",)
@@ -29,7 +28,7 @@ def _parse_dotenv_file(path: Path) -> dict[str, str | None]:
     config_data = {}
     content = path.read_text(encoding="utf-8")
 
-    for line_num, line in enumerate(content.splitlines(), 1):
+    for line in content.splitlines():
         line = line.strip()
 
         # Skip empty lines and comments
@@ -115,9 +114,10 @@ class Configuration(File):
                 }
             elif format_type == "env":
                 # Parse as dotenv format
-                lines = content.strip().split("\n")
+                # Blank lines are skipped below, so the content is split as
+                # is rather than stripping a copy of it first
                 config_data = {}
-                for line in lines:
+                for line in content.split("\n"):
                     line = line.strip()
                     if line and not line.startswith("#") and "=" in line:
                         key, value = line.split("=", 1)
@@ -328,32 +328,32 @@ class Configuration(File):
         Returns:
             A new Configuration instance
         """
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(url, headers=headers or {})
-            response.raise_for_status()
-
-            # Get content as text
-            content = response.text
-
-            # Determine format from URL extension or content-type
-            format_type = None
-            if url.endswith(".json"):
+        client = _get_http_client()
+        response = client.get(url, headers=headers or {}, timeout=timeout)
+        response.raise_for_status()
+
+        # Get content as text
+        content = response.text
+
+        # Determine format from URL extension or content-type
+        format_type = None
+        if url.endswith(".json"):
+            format_type = "json"
+        elif url.endswith((".yaml", ".yml")):
+            format_type = "yaml"
+        elif url.endswith(".toml"):
+            format_type = "toml"
+        elif url.endswith((".ini", ".cfg", ".conf")):
+            format_type = "ini"
+        elif url.endswith(".env"):
+            format_type = "env"
+        else:
+            # Try to detect from content-type header
+            content_type = response.headers.get("content-type", "").lower()
+            if "json" in content_type:
                 format_type = "json"
-            elif url.endswith((".yaml", ".yml")):
+            elif "yaml" in content_type:
                 format_type = "yaml"
-            elif url.endswith(".toml"):
-                format_type = "toml"
-            elif url.endswith((".ini", ".cfg", ".conf")):
-                format_type = "ini"
-            elif url.endswith(".env"):
-                format_type = "env"
-            else:
-                # Try to detect from content-type header
-                content_type = response.headers.get("content-type", "").lower()
-                if "json" in content_type:
-                    format_type = "json"
-                elif "yaml" in content_type:
-                    format_type = "yaml"
 
         config = cls(
             data=content,
@@ -1,14 +1,21 @@
 """ham.core.types.file"""
 
+from functools import lru_cache
 from pathlib import Path
-import httpx
-from typing import Any, Self
+import atexit
+import os
+import stat
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Self
 import mimetypes
 from urllib.parse import urlparse
 
 from ..models.model import Model
 from ..models.fields import field
 
+if TYPE_CHECKING:
+    import httpx
+
 __all__ = (
     "File",
     "FileSource",
@@ -28,8 +35,96 @@ _FILE_SIGNATURES = {
 }
 
 
-_mime_cache: dict[str, str] = {}
-"""Cache for MIME types."""
+_FILE_SIGNATURES_BY_LENGTH: tuple[tuple[int, dict[bytes, str]], ...] = tuple(
+    (
+        length,
+        {sig: mime for sig, mime in _FILE_SIGNATURES.items() if len(sig) == length},
+    )
+    for length in sorted({len(sig) for sig in _FILE_SIGNATURES}, reverse=True)
+)
+"""File signatures grouped by length (longest first), so content is matched
+with one dict lookup per distinct signature length."""
+
+
+def _detect_signature(data: bytes) -> str | None:
+    """Returns the MIME type of the file signature `data` starts with."""
+    for length, signatures in _FILE_SIGNATURES_BY_LENGTH:
+        if mime := signatures.get(bytes(data[:length])):
+            return mime
+    return None
+
+
+@lru_cache(maxsize=512)
+def _mime_for_suffix(suffix: str) -> str | None:
+    """Returns the MIME type `mimetypes.guess_type` resolves for a file
+    suffix (or suffix pair, such as `.tar.gz`), normalized by `_mime_for_path`.
+
+    Cached by suffix rather than by full path, so every file sharing an
+    extension resolves to the same entry."""
+    return mimetypes.guess_type("x" + suffix)[0]
+
+
+def _mime_for_path(path: str) -> str | None:
+    """Returns the MIME type for a file path from its suffix. Compression
+    suffixes such as `.gz` are looked up together with the suffix before
+    them, as `guess_type` resolves `a.tar.gz` by its `.tar`.
+
+    `mimetypes.encodings_map` is case-sensitive (`.Z` is an encoding, `.z`
+    is not), so the suffix is only lowercased where that does not change
+    whether it is treated as one."""
+    base, suffix = os.path.splitext(path)
+    if suffix in mimetypes.encodings_map:
+        suffix = os.path.splitext(base)[1].lower() + suffix
+    elif suffix.lower() not in mimetypes.encodings_map:
+        suffix = suffix.lower()
+    return _mime_for_suffix(suffix)
+
+
+def _url_name(url: str) -> str:
+    """Returns the last path segment of a URL, or its host if the path has
+    none. Plain `scheme://host/path` URLs are split directly, only falling
+    back to `urlparse` for anything less common."""
+    end = len(url)
+    for char in "?#":
+        index = url.find(char, 0, end)
+        if index >= 0:
+            end = index
+
+    scheme_end = url.find("://", 0, end)
+    if scheme_end > 0:
+        netloc, _, path = url[scheme_end + 3 : end].partition("/")
+        name = path.rpartition("/")[2]
+        if ";" not in name:
+            return name or netloc
+
+    parsed = urlparse(url)
+    return parsed.path.split("/")[-1] or parsed.netloc
+
+
+_http_client: "httpx.Client | None" = None
+"""HTTP client shared by the `from_url` constructors."""
+
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> "httpx.Client":
+    """Returns the shared HTTP client, creating it on first use.
+
+    Reusing a single client keeps connections to a host alive between
+    requests, rather than setting up a new pool (and TLS context) for every
+    download. httpx is imported here as it is slow to import and only needed
+    once a URL is fetched."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+
+                _http_client = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=20)
+                )
+                atexit.register(_http_client.close)
+    return _http_client
 
 
 class FileSource(Model, kw_only=True, dict=True, frozen=True):
@@ -63,44 +158,29 @@ class File(Model, kw_only=True, dict=True):
     source: FileSource = field(default_factory=FileSource)
     """The source of the data. Contains metadata as well."""
 
-    # Private cached attributes
-    _name: str | None = field(default=None)
-    _extension: str | None = field(default=None)
-    _repr: str | None = field(default=None)
-
     @property
     def name(self) -> str | None:
         """Returns the name of this data object."""
-        if self._name is not None:
-            return self._name
-
         if self.source.path:
-            self._name = self.source.path.name
+            name = self.source.path.name
         elif self.source.url:
-            parsed = urlparse(self.source.url)
-            self._name = parsed.path.split("/")[-1] or parsed.netloc
+            name = _url_name(self.source.url)
         else:
-            self._name = ""  # Cache empty result
+            name = ""
 
-        return self._name if self._name else None
+        return name if name else None
 
     @property
     def extension(self) -> str | None:
         """Returns the extension of this data object."""
-        if self._extension is not None:
-            return self._extension
-
         if self.source.path:
-            self._extension = self.source.path.suffix
-        elif name := self.name:
-            if "." in name:
-                self._extension = f".{name.rsplit('.', 1)[-1]}"
-            else:
-                self._extension = ""  # Cache empty result
+            extension = self.source.path.suffix
+        elif (name := self.name) and "." in name:
+            extension = f".{name.rsplit('.', 1)[-1]}"
         else:
-            self._extension = ""  # Cache empty result
+            extension = ""
 
-        return self._extension if self._extension else None
+        return extension if extension else None
 
     @property
     def exists(self) -> bool:
@@ -162,9 +242,6 @@ class File(Model, kw_only=True, dict=True):
 
     def __repr__(self) -> str:
         """Returns a string representation of the data object."""
-        if self._repr is not None:
-            return self._repr
-
         parts = []
 
         if self.source.path:
@@ -195,8 +272,7 @@ class File(Model, kw_only=True, dict=True):
         if self.source.encoding:
             parts.append(f"encoding={self.source.encoding!r}")
 
-        self._repr = f"<{', '.join(parts)}>"
-        return self._repr
+        return f"<{', '.join(parts)}>"
 
     def __eq__(self, other: Any) -> bool:
         """Returns whether this data object is equal to another."""
@@ -221,27 +297,22 @@ class File(Model, kw_only=True, dict=True):
         Returns:
             A new Data instance representing the file or directory.
         """
-        path = Path(path)
-
-        # Use cached stat call
+        # Stat the path string directly rather than through `Path.stat`
+        path_str = path if isinstance(path, str) else os.fspath(path)
         try:
-            stat = path.stat()
-            is_file = stat.st_mode & 0o170000 == 0o100000  # S_IFREG
-            is_dir = stat.st_mode & 0o170000 == 0o040000  # S_IFDIR
-            size = stat.st_size if is_file else None
+            st = os.stat(path_str)
+            is_file = stat.S_ISREG(st.st_mode)
+            is_dir = stat.S_ISDIR(st.st_mode)
+            size = st.st_size if is_file else None
         except OSError:
             is_file = is_dir = False
             size = None
 
-        # Get MIME type for files using cache
-        mime_type = None
-        if is_file:
-            path_str = str(path)
-            if path_str in _mime_cache:
-                mime_type = _mime_cache[path_str]
-            else:
-                mime_type, _ = mimetypes.guess_type(path_str)
-                _mime_cache[path_str] = mime_type
+        # Get MIME type for files from the (cached) suffix lookup
+        mime_type = _mime_for_path(path_str) if is_file else None
+
+        if not isinstance(path, Path):
+            path = Path(path_str)
 
         # Load data if not lazy and it's a file
         data = None
@@ -264,6 +335,65 @@ class File(Model, kw_only=True, dict=True):
             ),
         )
 
+    @classmethod
+    def from_dir(
+        cls,
+        path: str | Path,
+        *,
+        recursive: bool = False,
+        encoding: str | None = None,
+    ) -> Iterator[Self]:
+        """Creates (lazy) data objects for each entry within a directory.
+
+        Uses `os.scandir`, so the file type of each entry is read from the
+        directory listing itself and only files are stat'ed for their size.
+
+        Args:
+            path: The directory path.
+            recursive: If True, also yield the entries of subdirectories.
+            encoding: Text encoding for reading text files.
+
+        Returns:
+            An iterator of Data instances, one per directory entry.
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                yield cls._from_dir_entry(entry, encoding=encoding)
+
+                # Symlinked directories are not followed, to avoid cycles
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    yield from cls.from_dir(
+                        entry.path, recursive=True, encoding=encoding
+                    )
+
+    @classmethod
+    def _from_dir_entry(
+        cls,
+        entry: os.DirEntry,
+        *,
+        encoding: str | None = None,
+    ) -> Self:
+        """Creates a lazy data object from an `os.scandir` entry."""
+        try:
+            is_file = entry.is_file()
+            is_dir = not is_file and entry.is_dir()
+            size = entry.stat().st_size if is_file else None
+        except OSError:
+            is_file = is_dir = False
+            size = None
+
+        return cls(
+            type=_mime_for_path(entry.name) if is_file else None,
+            source=FileSource(
+                is_file=is_file,
+                is_dir=is_dir,
+                is_url=False,
+                path=Path(entry.path),
+                size=size,
+                encoding=encoding,
+            ),
+        )
+
     @classmethod
     def from_url(
         cls,
@@ -284,33 +414,125 @@ class File(Model, kw_only=True, dict=True):
         Returns:
             A new Data instance representing the URL.
         """
-        data = None
-        size = None
-        encoding = None
-
         # Load data if not lazy
         if not lazy:
             try:
-                with httpx.Client() as client:
-                    response = client.get(url)
-                    response.raise_for_status()
+                client = _get_http_client()
+                response = client.get(url)
+                response.raise_for_status()
+                return cls._from_url_response(url, response, type=type)
+            except Exception:
+                # If download fails, still create the object but without data
+                pass
+
+        return cls._from_url_response(url, None, type=type)
+
+    @classmethod
+    def from_urls(
+        cls,
+        urls: Iterable[str],
+        *,
+        type: str | None = None,
+        concurrency: int = 20,
+    ) -> list[Self]:
+        """Downloads and creates data objects from multiple URLs, fetching
+        them concurrently.
 
-                    data = response.content
-                    size = len(data)
+        This runs `from_urls_async` in a new event loop, so cannot be called
+        from within a running one (await `from_urls_async` instead).
 
-                    # Get content type from response headers if not provided
-                    if not type:
-                        content_type = response.headers.get("content-type", "")
-                        type = content_type.split(";")[0] if content_type else None
+        Args:
+            urls: The URLs to create data from.
+            type: Optional MIME type override.
+            concurrency: Maximum number of requests in flight at once.
 
-                    # Get encoding from response if it's text content
-                    if response.headers.get("content-type", "").startswith("text/"):
-                        encoding = response.encoding
-                        data = response.text
+        Returns:
+            A list of Data instances, in the same order as `urls`.
 
-            except Exception:
-                # If download fails, still create the object but without data
-                pass
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+        """
+        import asyncio
+
+        return asyncio.run(
+            cls.from_urls_async(urls, type=type, concurrency=concurrency)
+        )
+
+    @classmethod
+    async def from_urls_async(
+        cls,
+        urls: Iterable[str],
+        *,
+        type: str | None = None,
+        concurrency: int = 20,
+    ) -> list[Self]:
+        """Asynchronously downloads and creates data objects from multiple
+        URLs, with up to `concurrency` requests in flight at once.
+
+        As with `from_url`, a URL that fails to download still produces a
+        data object, just without data.
+
+        Args:
+            urls: The URLs to create data from.
+            type: Optional MIME type override.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A list of Data instances, in the same order as `urls`.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+        """
+        import asyncio
+        import httpx
+
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency)
+        ) as client:
+
+            async def fetch(url: str) -> Self:
+                async with semaphore:
+                    try:
+                        response = await client.get(url)
+                        response.raise_for_status()
+                        return cls._from_url_response(url, response, type=type)
+                    except Exception:
+                        return cls._from_url_response(url, None, type=type)
+
+            return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+    @classmethod
+    def _from_url_response(
+        cls,
+        url: str,
+        response: "httpx.Response | None",
+        *,
+        type: str | None = None,
+    ) -> Self:
+        """Creates a data object for a URL from its response, or without
+        data if it was not downloaded."""
+        data = None
+        size = None
+        encoding = None
+
+        if response is not None:
+            data = response.content
+            size = len(data)
+
+            # Get content type from response headers if not provided
+            if not type:
+                content_type = response.headers.get("content-type", "")
+                type = content_type.split(";")[0] if content_type else None
+
+            # Get encoding from response if it's text content
+            if response.headers.get("content-type", "").startswith("text/"):
+                encoding = response.encoding
+                data = response.text
 
         return cls(
             data=data,
@@ -346,10 +568,7 @@ class File(Model, kw_only=True, dict=True):
         # Try to detect type from content if not provided
         if not type and data:
             # Check against pre-compiled signatures
-            for sig, mime in _FILE_SIGNATURES.items():
-                if data.startswith(sig):
-                    type = mime
-                    break
+            type = _detect_signature(data)
 
         return cls(
             data=data,
@@ -1,11 +1,17 @@
 """ham.core.types.multimodal.image"""
 
-import httpx
-import mimetypes
+import os
+import stat
 from pathlib import Path
 from typing import Self
 
-from .file import File, FileSource, _FILE_SIGNATURES
+from .file import (
+    File,
+    FileSource,
+    _detect_signature,
+    _get_http_client,
+    _mime_for_path,
+)
 from ..models.fields import field
 
 
@@ -61,20 +67,20 @@ class Image(File):
         type = None
 
         if not lazy:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
+            client = _get_http_client()
+            response = client.get(url, timeout=timeout)
+            response.raise_for_status()
 
-                data = response.content
-                size = len(data)
+            data = response.content
+            size = len(data)
 
-                # Get content type
-                content_type = response.headers.get("content-type", "")
-                type = content_type.split(";")[0] if content_type else None
+            # Get content type
+            content_type = response.headers.get("content-type", "")
+            type = content_type.split(";")[0] if content_type else None
 
-                # Validate it's an image
-                if type and not type.startswith("image/"):
-                    raise ValueError(f"URL does not point to an image: {type}")
+            # Validate it's an image
+            if type and not type.startswith("image/"):
+                raise ValueError(f"URL does not point to an image: {type}")
 
         return cls(
             data=data,
@@ -105,25 +111,24 @@ class Image(File):
         """
         path_obj = Path(path)
 
-        if not path_obj.exists():
-            raise FileNotFoundError(f"Image file not found: {path}")
+        # A single stat call covers both the existence and file checks
+        try:
+            st = os.stat(path_obj)
+        except OSError:
+            raise FileNotFoundError(f"Image file not found: {path}") from None
 
-        if not path_obj.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {path}")
 
         # Read the file data
         data = path_obj.read_bytes()
 
         # Detect MIME type
-        type = None
-        for sig, mime in _FILE_SIGNATURES.items():
-            if data.startswith(sig):
-                type = mime
-                break
+        type = _detect_signature(data)
 
-        # Fallback to mimetypes module
+        # Fallback to the extension
         if not type:
-            type, _ = mimetypes.guess_type(str(path))
+            type = _mime_for_path(path_obj.name)
 
         # Validate it's an image
         if type and not type.startswith("image/"):
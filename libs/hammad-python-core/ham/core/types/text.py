@@ -7,6 +7,7 @@ from various input types and objects."""
 from __future__ import annotations
 
 import json
+import re
 from abc import ABC
 from dataclasses import dataclass, field
 from enum import Enum
@@ -37,6 +38,11 @@ from ..conversion.text.converters import convert_to_text
 # -----------------------------------------------------------------------------
 
 
+_CODE_KEYWORDS_RE = re.compile(r"def |class |import |from ", re.IGNORECASE)
+"""Case-insensitive match for keywords that mark content as code, searched
+in one pass without lowercasing a copy of the content."""
+
+
 class OutputFormat(Enum):
     """Supported output formats for text conversion."""
 
@@ -334,17 +340,14 @@ class BaseText(ABC):
         if auto_detect:
             # Simple heuristics for format detection
             if self.content and isinstance(self.content, str):
-                content_lower = self.content.lower().strip()
+                content = self.content.strip()
 
                 # Check for JSON content
-                if content_lower.startswith("{") and content_lower.endswith("}"):
+                if content.startswith("{") and content.endswith("}"):
                     return self.to_format(OutputFormat.JSON, **kwargs)
 
                 # Check for code content
-                if any(
-                    keyword in content_lower
-                    for keyword in ["def ", "class ", "import ", "from "]
-                ):
+                if _CODE_KEYWORDS_RE.search(content):
                     return self.to_format(OutputFormat.MARKDOWN, **kwargs)
 
             # Check if this looks like schema documentation
@@ -29,9 +29,11 @@ if TYPE_CHECKING:
         from ham.genai.models.embeddings.types import EmbeddingModelName
     except ImportError:
         from ....genai.models.embeddings.types import EmbeddingModelName  # type: ignore
-else:
-    from .indexes.tantivy.index import TantivyCollectionIndex
-    from .indexes.qdrant.index import QdrantCollectionIndex, VectorSearchResult
+
+try:
+    from ham.core._internal import type_checking_importer
+except ImportError:
+    from ...core._internal import type_checking_importer  # type: ignore
 
 
 __all__ = (
@@ -41,6 +43,11 @@ __all__ = (
 )
 
 
+# `VectorSearchResult` is loaded lazily, so that the qdrant index (and its
+# dependencies) is only imported once a vector collection is used
+__getattr__ = type_checking_importer(__all__)
+
+
 CollectionType: TypeAlias = Union["TantivyCollectionIndex", "QdrantCollectionIndex"]
 """Alias for a type of collection index.
 
@@ -48,6 +55,28 @@ This is a union of TantivyCollectionIndex and QdrantCollectionIndex.
 """
 
 
+# Lazy import cache for the collection index classes
+_INDEX_CLASSES = {}
+
+
+def _get_tantivy_index() -> Type["TantivyCollectionIndex"]:
+    """Lazy import for the tantivy collection index"""
+    if "tantivy" not in _INDEX_CLASSES:
+        from .indexes.tantivy.index import TantivyCollectionIndex
+
+        _INDEX_CLASSES["tantivy"] = TantivyCollectionIndex
+    return _INDEX_CLASSES["tantivy"]
+
+
+def _get_qdrant_index() -> Type["QdrantCollectionIndex"]:
+    """Lazy import for the qdrant collection index"""
+    if "qdrant" not in _INDEX_CLASSES:
+        from .indexes.qdrant.index import QdrantCollectionIndex
+
+        _INDEX_CLASSES["qdrant"] = QdrantCollectionIndex
+    return _INDEX_CLASSES["qdrant"]
+
+
 class Collection:
     """
     A unified collection factory that creates the appropriate collection index type
@@ -172,7 +201,7 @@ class Collection:
         """
         if vector:
             # Vector collection using Qdrant
-            return QdrantCollectionIndex(
+            return _get_qdrant_index()(
                 name=name,
                 vector_size=vector_size,
                 schema=schema,
@@ -191,7 +220,7 @@ class Collection:
             )
         else:
             # Text search collection using Tantivy
-            return TantivyCollectionIndex(
+            return _get_tantivy_index()(
                 name=name,
                 schema=schema,
                 ttl=ttl,
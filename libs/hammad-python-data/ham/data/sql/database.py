@@ -1,6 +1,7 @@
 """hammad.data.sql.database"""
 
-from datetime import datetime, timezone, timedelta
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import (
     Any,
@@ -13,8 +14,9 @@ from typing import (
     Literal,
     final,
 )
-import uuid
 import json
+import math
+import sys
 
 try:
     from sqlalchemy import (
@@ -29,11 +31,12 @@ try:
         and_,
         or_,
         select,
-        insert,
-        update,
         delete,
+        func,
+        event,
         Engine,
     )
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
     from sqlalchemy.orm import sessionmaker, Session
     from sqlalchemy.sql import Select
 
@@ -52,6 +55,9 @@ from .types import (
     QueryOperator,
     QueryCondition,
     QueryFilter,
+    _generate_item_id,
+    _now_utc,
+    _UTC,
 )
 
 __all__ = [
@@ -65,6 +71,50 @@ class DatabaseError(Exception):
     """Exception raised when an error occurs in the Database."""
 
 
+_QUERY_OPERATORS: Dict[str, Any] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "in": lambda column, value: column.in_(value),
+    "not_in": lambda column, value: ~column.in_(value),
+    "like": lambda column, value: column.like(value),
+    "ilike": lambda column, value: column.ilike(value),
+    "is_null": lambda column, value: column.is_(None),
+    "is_not_null": lambda column, value: column.isnot(None),
+    "startswith": lambda column, value: column.like(f"{value}%"),
+    "endswith": lambda column, value: column.like(f"%{value}"),
+    "contains": lambda column, value: column.like(f"%{value}%"),
+}
+"""Builds the SQLAlchemy condition for each `QueryOperator`, so a condition
+is built with a single lookup rather than a chain of comparisons."""
+
+
+def _enable_wal(dbapi_connection: Any, connection_record: Any) -> None:
+    """Switch a new SQLite connection to write-ahead log journaling."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to a stored timestamp, as SQLite returns naive datetimes
+    for the UTC times written by the database."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+    return value
+
+
+def _is_expired(created_at: datetime, ttl: Optional[int], now: datetime) -> bool:
+    """Check if a stored row has expired as of `now`."""
+    if ttl is None:
+        return False
+    return now >= _as_utc(created_at) + timedelta(seconds=ttl)
+
+
 @final
 class Database(Generic[DatabaseItemType]):
     """
@@ -107,13 +157,20 @@ class Database(Generic[DatabaseItemType]):
                 "Install with: pip install sqlalchemy"
             )
 
-        self.name = name
+        # Names are interned so every item the database returns shares (and
+        # compares by identity against) a single string object
+        self.name = sys.intern(name)
         self.schema = schema
         self.ttl = ttl
         self.path = Path(path) if path else None
-        self.table_name = table_name
+        self.table_name = sys.intern(table_name)
         self.auto_cleanup_expired = auto_cleanup_expired
 
+        # Earliest time (as a UNIX timestamp) any stored item can expire, so
+        # the expiry cleanup only runs once something may actually have
+        # expired. Starts at 0 so existing (file) databases are checked once.
+        self._next_expiry: float = 0.0
+
         # Initialize SQLAlchemy components
         self._engine: Optional[Engine] = None
         self._session_factory = None
@@ -142,6 +199,12 @@ class Database(Generic[DatabaseItemType]):
             pool_pre_ping=True,
         )
 
+        if self.path is not None:
+            # Journal file databases with a write-ahead log, which appends
+            # commits rather than rewriting pages in place and lets readers
+            # run alongside a writer; NORMAL sync is durable in WAL mode
+            event.listen(self._engine, "connect", _enable_wal)
+
         # Create session factory
         self._session_factory = sessionmaker(bind=self._engine)
 
@@ -157,7 +220,10 @@ class Database(Generic[DatabaseItemType]):
             Column("id", String, primary_key=True),
             Column("item_data", Text, nullable=False),  # JSON serialized item
             Column("filters", Text),  # JSON serialized filters
-            Column("created_at", DateTime, nullable=False),
+            # Indexed for the default query order. The expiry cleanup filters
+            # on an expression of `created_at` and `ttl`, which no index can
+            # serve, so it is skipped until the earliest expiry is due instead
+            Column("created_at", DateTime, nullable=False, index=True),
             Column("updated_at", DateTime, nullable=False),
             Column("ttl", Integer),  # TTL in seconds
             Column("table_name", String, default=self.table_name),
@@ -168,8 +234,6 @@ class Database(Generic[DatabaseItemType]):
 
     def _serialize_item(self, item: DatabaseItemType) -> str:
         """Serialize an item to JSON string."""
-        from dataclasses import is_dataclass, asdict
-
         if isinstance(item, (str, int, float, bool, type(None))):
             return json.dumps(item)
         elif isinstance(item, (list, dict)):
@@ -204,36 +268,9 @@ class Database(Generic[DatabaseItemType]):
             if column is None:
                 continue
 
-            if condition.operator == "eq":
-                conditions.append(column == condition.value)
-            elif condition.operator == "ne":
-                conditions.append(column != condition.value)
-            elif condition.operator == "gt":
-                conditions.append(column > condition.value)
-            elif condition.operator == "gte":
-                conditions.append(column >= condition.value)
-            elif condition.operator == "lt":
-                conditions.append(column < condition.value)
-            elif condition.operator == "lte":
-                conditions.append(column <= condition.value)
-            elif condition.operator == "in":
-                conditions.append(column.in_(condition.value))
-            elif condition.operator == "not_in":
-                conditions.append(~column.in_(condition.value))
-            elif condition.operator == "like":
-                conditions.append(column.like(condition.value))
-            elif condition.operator == "ilike":
-                conditions.append(column.ilike(condition.value))
-            elif condition.operator == "is_null":
-                conditions.append(column.is_(None))
-            elif condition.operator == "is_not_null":
-                conditions.append(column.isnot(None))
-            elif condition.operator == "startswith":
-                conditions.append(column.like(f"{condition.value}%"))
-            elif condition.operator == "endswith":
-                conditions.append(column.like(f"%{condition.value}"))
-            elif condition.operator == "contains":
-                conditions.append(column.like(f"%{condition.value}%"))
+            build = _QUERY_OPERATORS.get(condition.operator)
+            if build is not None:
+                conditions.append(build(column, condition.value))
 
         if not conditions:
             return None
@@ -243,30 +280,61 @@ class Database(Generic[DatabaseItemType]):
         else:  # or
             return or_(*conditions)
 
-    def _cleanup_expired_items(self, session: Session) -> int:
-        """Remove expired items from the database."""
+    def _expired_condition(self, now: datetime) -> Any:
+        """SQL condition matching items expired as of `now` (created_at + ttl
+        <= now). The age is compared in seconds, as SQLite has no interval
+        arithmetic."""
+        age = (func.julianday(now) - func.julianday(self._table.c.created_at)) * 86400
+        return and_(self._table.c.ttl.isnot(None), age >= self._table.c.ttl)
+
+    def _cleanup_expired_items(self, session: Session, force: bool = False) -> int:
+        """Remove expired items from the database.
+
+        Skipped until the earliest expiry time of the stored items is reached,
+        unless `force` is set. When it runs, the session is committed before
+        the next expiry time is recorded, so a rolled back delete is retried."""
         if not self.auto_cleanup_expired:
             return 0
 
-        now = datetime.now(timezone.utc)
-
-        # Find expired items by checking created_at + ttl < now
-        stmt = select(self._table).where(
-            and_(
-                self._table.c.ttl.isnot(None),
-                self._table.c.created_at + (self._table.c.ttl * timedelta(seconds=1))
-                < now,
-            )
-        )
+        now = _now_utc()
+        if not force and now.timestamp() < self._next_expiry:
+            return 0
 
-        expired_items = session.execute(stmt).fetchall()
-        expired_ids = [item.id for item in expired_items]
+        # Delete expired items in a single statement, rather than loading every
+        # expired row to collect its id first
+        stmt = delete(self._table).where(self._expired_condition(now))
 
-        if expired_ids:
-            delete_stmt = delete(self._table).where(self._table.c.id.in_(expired_ids))
-            session.execute(delete_stmt)
+        count = session.execute(stmt).rowcount
 
-        return len(expired_ids)
+        # Find when the next remaining item expires, converting julian days to
+        # a UNIX timestamp
+        next_expiry = session.execute(
+            select(
+                func.min(
+                    (func.julianday(self._table.c.created_at) - 2440587.5) * 86400
+                    + self._table.c.ttl
+                )
+            )
+        ).scalar()
+
+        session.commit()
+        self._next_expiry = math.inf if next_expiry is None else next_expiry
+
+        return count
+
+    def _upsert_statement(self) -> Any:
+        """Build an insert that updates the data, filters, ttl and update time
+        of an existing item with the same id, keeping its creation time."""
+        stmt = sqlite_insert(self._table)
+        return stmt.on_conflict_do_update(
+            index_elements=[self._table.c.id],
+            set_={
+                "item_data": stmt.excluded.item_data,
+                "filters": stmt.excluded.filters,
+                "updated_at": stmt.excluded.updated_at,
+                "ttl": stmt.excluded.ttl,
+            },
+        )
 
     def add(
         self,
@@ -290,45 +358,33 @@ class Database(Generic[DatabaseItemType]):
         """
         self._validate_schema(item)
 
-        item_id = id or str(uuid.uuid4())
+        item_id = id or _generate_item_id()
         item_ttl = ttl or self.ttl
-        now = datetime.now(timezone.utc)
+        now = _now_utc()
 
         serialized_item = self._serialize_item(item)
         serialized_filters = json.dumps(filters or {})
 
         with self._session_factory() as session:
-            # Check if item already exists
-            existing = session.execute(
-                select(self._table).where(self._table.c.id == item_id)
-            ).fetchone()
-
-            if existing:
-                # Update existing item
-                stmt = (
-                    update(self._table)
-                    .where(self._table.c.id == item_id)
-                    .values(
-                        item_data=serialized_item,
-                        filters=serialized_filters,
-                        updated_at=now,
-                        ttl=item_ttl,
-                    )
-                )
-            else:
-                # Insert new item
-                stmt = insert(self._table).values(
-                    id=item_id,
-                    item_data=serialized_item,
-                    filters=serialized_filters,
-                    created_at=now,
-                    updated_at=now,
-                    ttl=item_ttl,
-                    table_name=self.table_name,
-                )
-
+            # Insert the item, or update it if the id already exists, as a
+            # single atomic statement rather than a check followed by a write
+            stmt = self._upsert_statement().values(
+                id=item_id,
+                item_data=serialized_item,
+                filters=serialized_filters,
+                created_at=now,
+                updated_at=now,
+                ttl=item_ttl,
+                table_name=self.table_name,
+            )
             session.execute(stmt)
 
+            if item_ttl is not None:
+                # An existing item keeps its creation time, so may expire
+                # sooner than `now + ttl`; have the cleanup look it up
+                expires = now.timestamp() + item_ttl if id is None else 0.0
+                self._next_expiry = min(self._next_expiry, expires)
+
             # Cleanup expired items
             self._cleanup_expired_items(session)
 
@@ -336,6 +392,68 @@ class Database(Generic[DatabaseItemType]):
 
         return item_id
 
+    def add_many(
+        self,
+        items: List[DatabaseItemType],
+        *,
+        ids: Optional[List[str]] = None,
+        filters: Optional[DatabaseItemFilters] = None,
+        ttl: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Add multiple items to the database in a single transaction.
+
+        Args:
+            items: The items to store
+            ids: Optional IDs, one per item (will generate UUIDs if not provided)
+            filters: Optional filters/metadata applied to every item
+            ttl: Optional TTL in seconds
+
+        Returns:
+            The IDs of the stored items, in order
+        """
+        if ids is not None and len(ids) != len(items):
+            raise ValueError("The number of ids must match the number of items.")
+        if not items:
+            return []
+
+        for item in items:
+            self._validate_schema(item)
+
+        item_ids = ids or [_generate_item_id() for _ in items]
+        item_ttl = ttl or self.ttl
+        now = _now_utc()
+        serialized_filters = json.dumps(filters or {})
+
+        with self._session_factory() as session:
+            session.execute(
+                self._upsert_statement(),
+                [
+                    {
+                        "id": item_id,
+                        "item_data": self._serialize_item(item),
+                        "filters": serialized_filters,
+                        "created_at": now,
+                        "updated_at": now,
+                        "ttl": item_ttl,
+                        "table_name": self.table_name,
+                    }
+                    for item_id, item in zip(item_ids, items)
+                ],
+            )
+
+            if item_ttl is not None:
+                # Same as `add`, given ids may update existing items
+                expires = now.timestamp() + item_ttl if ids is None else 0.0
+                self._next_expiry = min(self._next_expiry, expires)
+
+            # Cleanup expired items
+            self._cleanup_expired_items(session)
+
+            session.commit()
+
+        return item_ids
+
     def get(
         self,
         id: str,
@@ -360,32 +478,29 @@ class Database(Generic[DatabaseItemType]):
                 return None
 
             # Check if expired
-            if result.ttl is not None:
-                expires_at = result.created_at + timedelta(seconds=result.ttl)
-                if datetime.now(timezone.utc) >= expires_at:
-                    # Delete expired item
-                    session.execute(delete(self._table).where(self._table.c.id == id))
-                    session.commit()
-                    return None
-
-            # Check filters if provided
-            if filters:
-                stored_filters = json.loads(result.filters or "{}")
-                if not all(stored_filters.get(k) == v for k, v in filters.items()):
-                    return None
+            if _is_expired(result.created_at, result.ttl, _now_utc()):
+                # Delete expired item
+                session.execute(delete(self._table).where(self._table.c.id == id))
+                session.commit()
+                return None
+
+            # Check filters if provided, parsing the stored filters once for
+            # both the check and the returned item
+            stored_filters = json.loads(result.filters or "{}")
+            if filters and not filters.items() <= stored_filters.items():
+                return None
 
             # Deserialize and return
             item_data = self._deserialize_item(result.item_data)
-            stored_filters = json.loads(result.filters or "{}")
 
             return DatabaseItem(
                 id=result.id,
                 item=item_data,
-                created_at=result.created_at,
-                updated_at=result.updated_at,
+                created_at=_as_utc(result.created_at),
+                updated_at=_as_utc(result.updated_at),
                 ttl=result.ttl,
                 filters=stored_filters,
-                table_name=result.table_name,
+                table_name=self.table_name,
             )
 
     def query(
@@ -414,7 +529,9 @@ class Database(Generic[DatabaseItemType]):
             # Cleanup expired items first
             self._cleanup_expired_items(session)
 
-            stmt = select(self._table)
+            # Expired items are excluded by the query itself, as the cleanup
+            # only runs once an item may have expired
+            stmt = select(self._table).where(~self._expired_condition(_now_utc()))
 
             # Apply filters
             if query_filter:
@@ -444,12 +561,6 @@ class Database(Generic[DatabaseItemType]):
 
             items = []
             for result in results:
-                # Double-check expiration (in case of race conditions)
-                if result.ttl is not None:
-                    expires_at = result.created_at + timedelta(seconds=result.ttl)
-                    if datetime.now(timezone.utc) >= expires_at:
-                        continue
-
                 item_data = self._deserialize_item(result.item_data)
                 stored_filters = json.loads(result.filters or "{}")
 
@@ -457,11 +568,11 @@ class Database(Generic[DatabaseItemType]):
                     DatabaseItem(
                         id=result.id,
                         item=item_data,
-                        created_at=result.created_at,
-                        updated_at=result.updated_at,
+                        created_at=_as_utc(result.created_at),
+                        updated_at=_as_utc(result.updated_at),
                         ttl=result.ttl,
                         filters=stored_filters,
-                        table_name=result.table_name,
+                        table_name=self.table_name,
                     )
                 )
 
@@ -500,9 +611,9 @@ class Database(Generic[DatabaseItemType]):
             # Cleanup expired items first
             self._cleanup_expired_items(session)
 
-            from sqlalchemy import func
-
-            stmt = select(func.count(self._table.c.id))
+            stmt = select(func.count(self._table.c.id)).where(
+                ~self._expired_condition(_now_utc())
+            )
 
             if query_filter:
                 conditions = self._build_query_conditions(query_filter, self._table)
@@ -523,6 +634,7 @@ class Database(Generic[DatabaseItemType]):
             stmt = delete(self._table)
             result = session.execute(stmt)
             session.commit()
+            self._next_expiry = math.inf
             return result.rowcount
 
     def cleanup_expired(self) -> int:
@@ -533,7 +645,7 @@ class Database(Generic[DatabaseItemType]):
             Number of items cleaned up
         """
         with self._session_factory() as session:
-            count = self._cleanup_expired_items(session)
+            count = self._cleanup_expired_items(session, force=True)
             session.commit()
             return count
 
@@ -1,7 +1,8 @@
 """hammad.data.sql.types"""
 
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
+from functools import partial
 from typing import (
     Any,
     Dict,
@@ -13,7 +14,7 @@ from typing import (
     Literal,
     Union,
 )
-import uuid
+import os
 
 __all__ = (
     "DatabaseItemType",
@@ -25,6 +26,23 @@ __all__ = (
 )
 
 
+_UTC = timezone.utc
+_now_utc = partial(datetime.now, _UTC)
+"""Return the current time as an aware UTC datetime."""
+
+
+def _generate_item_id() -> str:
+    """Generate a random (version 4) UUID string for a database item.
+
+    Formats `os.urandom` bytes directly, which is cheaper than building a
+    `uuid.UUID` and converting it, and gives the same format (item ids are
+    also used as qdrant point ids, which must be UUIDs)."""
+    h = os.urandom(16).hex()
+    return (
+        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+    )
+
+
 DatabaseItemType = TypeVar("DatabaseItemType")
 """Generic type variable for any valid item type that can be stored
 within a database."""
@@ -79,21 +97,22 @@ class QueryFilter:
     """Logical operator to combine conditions."""
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseItem(Generic[DatabaseItemType]):
     """Base class for all items that can be stored within a database."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_generate_item_id)
     """The unique identifier for this item."""
 
     item: DatabaseItemType = field(default_factory=lambda: None)
     """The item that is stored within this database item."""
 
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_now_utc)
     """The timestamp when this item was created."""
 
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    """The timestamp when this item was last updated."""
+    updated_at: Optional[datetime] = field(default=None)
+    """The timestamp when this item was last updated (defaults to
+    `created_at`)."""
 
     ttl: Optional[int] = field(default=None)
     """The time to live for this item in seconds."""
@@ -107,21 +126,22 @@ class DatabaseItem(Generic[DatabaseItemType]):
     score: Optional[float] = field(default=None)
     """The similarity score for this item (used in vector search results)."""
 
+    def __post_init__(self) -> None:
+        # A new item is created and last updated at the same instant
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
     def is_expired(self) -> bool:
         """Check if this item has expired based on its TTL."""
         if self.ttl is None:
             return False
 
-        from datetime import timedelta
-
         expires_at = self.created_at + timedelta(seconds=self.ttl)
-        return datetime.now(timezone.utc) >= expires_at
+        return _now_utc() >= expires_at
 
     def expires_at(self) -> Optional[datetime]:
         """Calculate when this item will expire."""
         if self.ttl is None:
             return None
 
-        from datetime import timedelta
-
         return self.created_at + timedelta(seconds=self.ttl)
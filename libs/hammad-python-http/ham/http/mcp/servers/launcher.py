@@ -16,12 +16,14 @@ import sys
 import socket
 import subprocess
 import inspect
+import json
 import signal
+import select
 import time
 import atexit
 import threading
 from dataclasses import dataclass, field
-from typing import Callable, List, Literal, Dict, Any, Optional, Tuple, Union
+from typing import Callable, List, Literal, Dict, Any, Optional, Set, Tuple, Union
 from queue import Queue
 import os
 
@@ -127,6 +129,147 @@ ServerSettings = Union[
 ]
 
 
+class _StdinLineReader:
+    """
+    Async line iterator over a raw stdin file descriptor. Reads are
+    abandoned on cancellation and never hold the `sys.stdin` buffer
+    lock, so an in-process server can be stopped while waiting on input.
+    """
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._buffer = b""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        import anyio.to_thread
+
+        while b"\n" not in self._buffer:
+            chunk = await anyio.to_thread.run_sync(
+                os.read, self._fd, 65536, abandon_on_cancel=True
+            )
+            if not chunk:
+                if not self._buffer:
+                    raise StopAsyncIteration
+                line, self._buffer = self._buffer, b""
+                return line.decode("utf-8", errors="replace")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.decode("utf-8", errors="replace") + "\n"
+
+
+class _InProcessServerProcess:
+    """
+    Popen-like handle for a stdio MCP server running on a background
+    thread within the current process, rather than in a subprocess.
+    """
+
+    def __init__(self, server: Any, name: str):
+        self.pid = os.getpid()
+        self.args = [name]
+        self.returncode: Optional[int] = None
+        self.stdout = None
+        self.stderr = None
+        self._server = server
+        self._token = None
+        self._stop_event = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"mcp-stdio-{name}", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start the server thread and wait for its event loop to come up."""
+        self._thread.start()
+        self._started.wait()
+
+    def _run(self) -> None:
+        import anyio
+
+        try:
+            anyio.run(self._serve)
+            if self.returncode is None:
+                self.returncode = 0
+        except Exception as e:
+            logger.error(f"In-process server '{self.args[0]}' failed: {e}")
+            if self.returncode is None:
+                self.returncode = 1
+        finally:
+            self._started.set()
+
+    async def _serve(self) -> None:
+        import io
+        import anyio
+        import anyio.lowlevel
+        from mcp.server.stdio import stdio_server
+
+        self._token = anyio.lowlevel.current_token()
+        self._stop_event = anyio.Event()
+        self._started.set()
+
+        # Write through a duplicate of stdout so the transport closing its
+        # wrapper does not close this process's own stdout
+        stdout = anyio.wrap_file(
+            io.TextIOWrapper(
+                os.fdopen(os.dup(sys.stdout.fileno()), "wb"), encoding="utf-8"
+            )
+        )
+        mcp_server = self._server._mcp_server
+
+        async with anyio.create_task_group() as task_group:
+
+            async def run_server():
+                async with stdio_server(
+                    stdin=_StdinLineReader(sys.stdin.fileno()), stdout=stdout
+                ) as (read_stream, write_stream):
+                    await mcp_server.run(
+                        read_stream,
+                        write_stream,
+                        mcp_server.create_initialization_options(),
+                    )
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(run_server)
+            await self._stop_event.wait()
+            task_group.cancel_scope.cancel()
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code if the server has stopped, otherwise None."""
+        if self.returncode is None and self._thread.is_alive():
+            return None
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Wait for the server thread to stop."""
+        if self.returncode is not None:
+            return self.returncode
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def terminate(self) -> None:
+        """Ask the server's event loop to cancel and shut down."""
+        if self._token is None or not self._thread.is_alive():
+            return
+        import anyio.from_thread
+
+        try:
+            anyio.from_thread.run_sync(self._stop_event.set, token=self._token)
+        except RuntimeError:
+            # The event loop already finished
+            pass
+
+    def kill(self) -> None:
+        """Abandon the server thread. Reads from stdin cannot be cancelled,
+        so the daemon thread is left to exit with the interpreter."""
+        self.terminate()
+        if self._thread.is_alive() and self.returncode is None:
+            self.returncode = -signal.SIGKILL
+
+
 def _monitor_process_output(process: subprocess.Popen, name: str, stream_name: str):
     """Monitor and log process output in a separate thread."""
     stream = process.stdout if stream_name == "stdout" else process.stderr
@@ -142,6 +285,95 @@ def _monitor_process_output(process: subprocess.Popen, name: str, stream_name: s
         logger.error(f"Error reading {stream_name} from {name}: {e}")
 
 
+def _open_pidfd(process: subprocess.Popen) -> Optional[int]:
+    """Open a pidfd for the process, or return None where pidfds are
+    not supported (non-Linux platforms or kernels older than 5.3)."""
+    if not isinstance(process, subprocess.Popen):
+        return None
+    if not (hasattr(os, "pidfd_open") and hasattr(signal, "pidfd_send_signal")):
+        return None
+    try:
+        return os.pidfd_open(process.pid)
+    except OSError:
+        return None
+
+
+def _get_runner_cache_dir() -> str:
+    """Directory that holds generated runner scripts between launches."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "hammad", "runners")
+
+
+# Cached runners that have not been launched for this long are removed
+# whenever a new runner is written to the cache.
+_RUNNER_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def _prune_runner_cache(cache_dir: str) -> None:
+    """Remove cached runner files that have not been used recently."""
+    cutoff = time.time() - _RUNNER_CACHE_MAX_AGE
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug(f"Could not prune runner cache {cache_dir}: {e}")
+
+
+def _get_cached_runner_path(script_content: str, python_executable: str) -> str:
+    """
+    Writes the runner script to a cache file keyed by its content hash
+    (once) and returns the path to launch.
+
+    When the server runs on this same interpreter, the script is also
+    compiled to a `.pyc` once and that path is returned instead, so
+    repeat launches skip parsing and compiling the script entirely.
+    CPython never caches bytecode for a `__main__` script on its own.
+
+    Reused entries have their modification time refreshed, and entries
+    unused for `_RUNNER_CACHE_MAX_AGE` are pruned when a new one is written.
+    """
+    import hashlib
+    import py_compile
+
+    digest = hashlib.blake2b(script_content.encode("utf-8"), digest_size=16).hexdigest()
+    cache_dir = _get_runner_cache_dir()
+    source_path = os.path.join(cache_dir, f"{digest}.py")
+
+    if os.path.exists(source_path):
+        os.utime(source_path)
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        _prune_runner_cache(cache_dir)
+        temp_path = f"{source_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(script_content)
+        os.replace(temp_path, source_path)
+
+    if python_executable != sys.executable:
+        # Bytecode is only valid for the interpreter that compiled it
+        return source_path
+
+    compiled_path = os.path.join(
+        cache_dir, f"{digest}.{sys.implementation.cache_tag}.pyc"
+    )
+    if os.path.exists(compiled_path):
+        os.utime(compiled_path)
+    else:
+        try:
+            py_compile.compile(source_path, cfile=compiled_path, doraise=True)
+        except py_compile.PyCompileError as e:
+            logger.debug(f"Could not precompile runner script: {e}")
+            return source_path
+    return compiled_path
+
+
 def find_next_free_port(start_port: int = 8000, host: str = "127.0.0.1") -> int:
     """
     Finds the next free port starting from the given start_port.
@@ -163,6 +395,10 @@ def find_next_free_port(start_port: int = 8000, host: str = "127.0.0.1") -> int:
 # Global variables for signal handling
 _signal_handlers_registered = False
 
+# Guards one-time creation of the singleton service and signal handlers.
+# Reentrant, as creating the service registers the signal handlers.
+_singleton_lock = threading.RLock()
+
 
 def _register_signal_handlers():
     """Register signal handlers for graceful shutdown."""
@@ -170,30 +406,41 @@ def _register_signal_handlers():
     if _signal_handlers_registered:
         return
 
-    def signal_handler(signum, frame):
-        logger.info(
-            f"Received signal {signum}. Shutting down all MCP server services..."
-        )
-        global _singleton_service
-        if _singleton_service is not None:
-            try:
-                _singleton_service.shutdown_all()
-            except Exception as e:
-                logger.error(f"Error during signal-triggered shutdown: {e}")
-        logger.info("Signal-triggered shutdown complete.")
+    with _singleton_lock:
+        if _signal_handlers_registered:
+            return
 
-    # Register handlers for common termination signals
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+        def signal_handler(signum, frame):
+            logger.info(
+                f"Received signal {signum}. Shutting down all MCP server services..."
+            )
+            service = globals().get("_singleton_service")
+            if service is not None:
+                try:
+                    service.shutdown_all()
+                except Exception as e:
+                    logger.error(f"Error during signal-triggered shutdown: {e}")
+            logger.info("Signal-triggered shutdown complete.")
+
+        # Register handlers for common termination signals. Signal handlers
+        # can only be installed from the main thread; elsewhere the atexit
+        # handler below is the only fallback.
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, signal_handler)
+            signal.signal(signal.SIGINT, signal_handler)
+        else:
+            logger.debug(
+                "MCPServerService created off the main thread, skipping signal handlers."
+            )
 
-    # Also register atexit handler as a fallback
-    def atexit_handler():
-        global _singleton_service
-        if _singleton_service is not None:
-            _singleton_service.shutdown_all()
+        # Also register atexit handler as a fallback
+        def atexit_handler():
+            service = globals().get("_singleton_service")
+            if service is not None:
+                service.shutdown_all()
 
-    atexit.register(atexit_handler)
-    _signal_handlers_registered = True
+        atexit.register(atexit_handler)
+        _signal_handlers_registered = True
 
 
 @dataclass
@@ -203,7 +450,8 @@ class MCPServerService:
     configured MCP servers by running them as subprocesses.
     """
 
-    active_servers: List[subprocess.Popen] = field(default_factory=list)
+    active_servers: Dict[int, subprocess.Popen] = field(default_factory=dict)
+    in_process_servers: List[_InProcessServerProcess] = field(default_factory=list)
     server_info: List[ServerInfo] = field(default_factory=list)
     output_threads: List[threading.Thread] = field(default_factory=list)
     python_executable: str = sys.executable
@@ -211,6 +459,8 @@ class MCPServerService:
         10.0  # seconds to wait for process startup verification
     )
     _keep_running: bool = field(default=True, init=False)
+    _process_group: Optional[int] = field(default=None, init=False)
+    _process_group_pids: Set[int] = field(default_factory=set, init=False)
 
     def __post_init__(self):
         """Register signal handlers when service is created."""
@@ -253,25 +503,52 @@ class MCPServerService:
             escaped_instructions = instructions.replace("'''", "'''")
             instructions_repr = f"'''{escaped_instructions}'''"
 
+        # Settings are passed as JSON so the runner decodes them with the C
+        # `json` parser, and anything unserializable fails here in the parent
+        settings_json = json.dumps(server_settings)
+        dependencies_json = json.dumps(dependencies)
+
+        # Only emit optional imports that a tool actually references, so
+        # servers don't pay for resolving them at startup
+        optional_import_lines = []
+        if any("anyio" in source for source in tools_source_code):
+            optional_import_lines.append("import anyio")
+        if any(
+            name in source
+            for source in tools_source_code
+            for name in ("UCPSearchClient", "SearchContentItem", "KnowledgeBit")
+        ):
+            optional_import_lines.extend(
+                [
+                    "",
+                    "# Import dependencies for UCP tool functions",
+                    "try:",
+                    "    from eval_interface.ucp.search_client import UCPSearchClient",
+                    "    from eval_interface.ucp.types import SearchContentItem, KnowledgeBit",
+                    "except ImportError as e:",
+                    "    logger.warning(f'Could not import UCP dependencies: {e}')",
+                    "    UCPSearchClient = None",
+                    "    SearchContentItem = None",
+                    "    KnowledgeBit = None",
+                ]
+            )
+
         script_lines = [
+            "import os",
             "import sys",
+            "",
+            "# Resolve imports from the working directory, as with `-c`, rather",
+            "# than from the runner cache directory this script is launched from",
+            "sys.path.insert(0, os.getcwd())",
+            "",
+            "import json",
             "from mcp.server.fastmcp import FastMCP",
             "from typing import Literal, List, Callable, Any, Dict",
-            "import anyio",  # FastMCP.run might use it implicitly or explicitly
             "import logging",  # For basic logging within the script if needed
             "",
             "# Set up logger for tool functions",
             "logger = logging.getLogger(__name__)",
-            "",
-            "# Import dependencies for UCP tool functions",
-            "try:",
-            "    from eval_interface.ucp.search_client import UCPSearchClient",
-            "    from eval_interface.ucp.types import SearchContentItem, KnowledgeBit",
-            "except ImportError as e:",
-            "    logger.warning(f'Could not import UCP dependencies: {e}')",
-            "    UCPSearchClient = None",
-            "    SearchContentItem = None",
-            "    KnowledgeBit = None",
+            *optional_import_lines,
             "",
             "# --- Tool Function Definitions ---",
             tool_definitions_str,
@@ -283,11 +560,11 @@ class MCPServerService:
             f"    logging.basicConfig(level='{log_level.upper()}', format=log_format)",
             "    script_logger = logging.getLogger('mcp_runner_script')",
             f'    script_logger.info(f"MCP Runner script for {name!r} starting with transport {transport!r}")',
-            f"    server_specific_settings = {server_settings!r}",
+            f"    server_specific_settings = json.loads({settings_json!r})",
             f"    server = FastMCP(",
             f"        name={name!r},",
             f"        instructions={instructions_repr},",
-            f"        dependencies={dependencies!r},",
+            f"        dependencies=json.loads({dependencies_json!r}),",
             f"        log_level='{log_level.upper()}',",
             f"        debug={debug_mode},",
             "        **server_specific_settings",
@@ -306,6 +583,65 @@ class MCPServerService:
         ]
         return "\n".join(script_lines)
 
+    def _spawn_server_process(
+        self, runner_args: List[str], cwd: str | None, transport: str
+    ) -> subprocess.Popen:
+        """
+        Spawns a server subprocess. On POSIX, every SSE and streamable-http
+        server joins one shared process group so `shutdown_all` can signal
+        them all at once.
+
+        Stdio servers stay in this process's group, as a background group
+        would be stopped with SIGTTIN when reading from the terminal.
+        """
+        popen_kwargs: Dict[str, Any] = {}
+        if os.name == "posix" and transport != "stdio":
+            popen_kwargs["process_group"] = self._process_group or 0
+
+        def spawn() -> subprocess.Popen:
+            # NOTE: CPython only launches through `posix_spawn` when
+            # `close_fds=False` and no `process_group` is set. Keeping
+            # `close_fds=True` so the parent's inheritable descriptors are
+            # not leaked is worth more here, and `_posixsubprocess` still
+            # uses `vfork` where it can.
+            return subprocess.Popen(
+                [self.python_executable, *runner_args],
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,  # Decode stdout/stderr as text
+                **popen_kwargs,
+            )
+
+        try:
+            process = spawn()
+        except PermissionError:
+            if not popen_kwargs.get("process_group"):
+                raise
+            # Every member of the previous group has exited, start a new one
+            logger.debug(
+                f"Process group {self._process_group} no longer exists, starting a new one."
+            )
+            popen_kwargs["process_group"] = 0
+            self._process_group_pids = set()
+            process = spawn()
+
+        if "process_group" in popen_kwargs:
+            if popen_kwargs["process_group"] == 0:
+                self._process_group = process.pid
+            self._process_group_pids.add(process.pid)
+        return process
+
+    def _release_process(self, process: subprocess.Popen) -> None:
+        """
+        Stops tracking a reaped process as a member of the shared process
+        group, forgetting the group once its last member is gone so a
+        later `killpg` cannot signal an unrelated group reusing its id.
+        """
+        self._process_group_pids.discard(process.pid)
+        if not self._process_group_pids:
+            self._process_group = None
+
     def _verify_process_started(self, process: subprocess.Popen, name: str) -> bool:
         """
         Verify that the process started successfully and is running.
@@ -400,21 +736,23 @@ class MCPServerService:
             f"Generated runner script for server '{name}' ({transport}):\n{script_content}"
         )
 
+        try:
+            runner_args = [
+                _get_cached_runner_path(script_content, self.python_executable)
+            ]
+        except OSError as e:
+            logger.debug(f"Could not cache runner script, passing it inline: {e}")
+            runner_args = ["-c", script_content]
+
         process = None
         try:
-            process = subprocess.Popen(
-                [self.python_executable, "-c", script_content],
-                cwd=cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,  # Decode stdout/stderr as text
-            )
+            process = self._spawn_server_process(runner_args, cwd, transport)
 
             logger.info(f"Launched {transport} server '{name}' with PID {process.pid}.")
 
             # Verify the process started successfully before adding to active_servers
             if self._verify_process_started(process, name):
-                self.active_servers.append(process)
+                self.active_servers[process.pid] = process
 
                 # Create server info
                 info = ServerInfo(
@@ -451,6 +789,7 @@ class MCPServerService:
                     f"Server '{name}' failed startup verification, cleaning up..."
                 )
                 self._cleanup_single_process(process, name, force_kill_timeout=2.0)
+                self._release_process(process)
                 raise RuntimeError(f"Server '{name}' failed to start properly")
 
         except Exception as e:
@@ -458,8 +797,53 @@ class MCPServerService:
             if process and process.poll() is None:
                 # If we created a process but had an error, clean it up
                 self._cleanup_single_process(process, name, force_kill_timeout=2.0)
+            if process:
+                self._release_process(process)
             raise
 
+    def launch_in_process_server(
+        self,
+        name: str,
+        instructions: str | None,
+        tools: List[Callable],
+        dependencies: List[str],
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        debug_mode: bool,
+    ) -> _InProcessServerProcess:
+        """
+        Runs a stdio MCP server on a background thread of the current
+        process, skipping script generation and interpreter startup.
+
+        The server thread is a daemon and `keep_servers_running` is not
+        started for it, as its status output would be written to the
+        stdout the server is serving on. The caller must keep the process
+        alive (e.g. by waiting on the returned handle), otherwise the
+        server stops silently once the main script ends.
+        """
+        from mcp.server.fastmcp import FastMCP
+
+        server = FastMCP(
+            name=name,
+            instructions=instructions,
+            dependencies=dependencies,
+            log_level=log_level.upper(),
+            debug=debug_mode,
+        )
+        for tool_func in tools:
+            server.add_tool(tool_func)
+
+        process = _InProcessServerProcess(server, name)
+        process.start()
+        if process.poll() is not None:
+            raise RuntimeError(f"Server '{name}' failed to start properly")
+
+        self.in_process_servers.append(process)
+        self.server_info.append(
+            ServerInfo(name=name, transport="stdio", process=process)
+        )
+        logger.info(f"Launched in-process stdio server '{name}'.")
+        return process
+
     def _cleanup_single_process(
         self, process: subprocess.Popen, name: str, force_kill_timeout: float = 5.0
     ):
@@ -476,6 +860,20 @@ class MCPServerService:
             return
 
         logger.info(f"Terminating server process '{name}' (PID {process.pid})...")
+        pidfd = _open_pidfd(process)
+        if pidfd is not None:
+            try:
+                self._cleanup_process_with_pidfd(
+                    process, pidfd, name, force_kill_timeout
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error during cleanup of process '{name}' (PID {process.pid}): {e}"
+                )
+            finally:
+                os.close(pidfd)
+            return
+
         try:
             process.terminate()  # Ask nicely first
             try:
@@ -497,6 +895,40 @@ class MCPServerService:
                 f"Error during cleanup of process '{name}' (PID {process.pid}): {e}"
             )
 
+    def _cleanup_process_with_pidfd(
+        self,
+        process: subprocess.Popen,
+        pidfd: int,
+        name: str,
+        force_kill_timeout: float,
+    ):
+        """
+        Terminate a process through its pidfd, blocking in the kernel until
+        it exits instead of polling `waitpid`.
+
+        Args:
+            process: The process to clean up
+            pidfd: An open pidfd referring to the process
+            name: Name for logging
+            force_kill_timeout: How long to wait before force killing
+        """
+        signal.pidfd_send_signal(pidfd, signal.SIGTERM)  # Ask nicely first
+        readable, _, _ = select.select([pidfd], [], [], force_kill_timeout)
+        if readable:
+            process.wait()  # Already exited, this only reaps it
+            logger.info(
+                f"Server process '{name}' (PID {process.pid}) terminated gracefully."
+            )
+            return
+
+        logger.warning(
+            f"Server process '{name}' (PID {process.pid}) did not terminate gracefully after {force_kill_timeout}s, killing."
+        )
+        signal.pidfd_send_signal(pidfd, signal.SIGKILL)  # Force kill
+        select.select([pidfd], [], [], 1.0)
+        process.wait()  # Ensure it's reaped
+        logger.info(f"Server process '{name}' (PID {process.pid}) killed.")
+
     def get_running_servers(self) -> List[subprocess.Popen]:
         """
         Get a list of currently running server processes.
@@ -505,28 +937,89 @@ class MCPServerService:
             List of running Popen objects
         """
         running = []
-        for server_process in self.active_servers:
+        for server_process in self.active_servers.values():
+            if server_process.poll() is None:
+                running.append(server_process)
+        for server_process in self.in_process_servers:
             if server_process.poll() is None:
                 running.append(server_process)
         return running
 
     def cleanup_dead_servers(self):
         """
-        Remove dead processes from the active_servers list.
+        Remove dead processes from the active_servers mapping.
         """
-        original_count = len(self.active_servers)
-        self.active_servers = [
-            server for server in self.active_servers if server.poll() is None
+        dead_pids = [
+            pid
+            for pid, server in self.active_servers.items()
+            if server.poll() is not None
         ]
-        self.server_info = [
-            info for info in self.server_info if info.process.poll() is None
-        ]
-        cleaned_count = original_count - len(self.active_servers)
+        dead_processes = [self.active_servers.pop(pid) for pid in dead_pids]
+        for process in dead_processes:
+            self._release_process(process)
+        dead_processes.extend(
+            server for server in self.in_process_servers if server.poll() is not None
+        )
+        if dead_processes:
+            self.in_process_servers = [
+                server
+                for server in self.in_process_servers
+                if server not in dead_processes
+            ]
+            self.server_info = [
+                info for info in self.server_info if info.process not in dead_processes
+            ]
+        cleaned_count = len(dead_processes)
         if cleaned_count > 0:
             logger.info(
                 f"Cleaned up {cleaned_count} dead server process(es) from active list."
             )
 
+    def _shutdown_process_group(
+        self, processes: List[subprocess.Popen], force_kill_timeout: float
+    ) -> List[subprocess.Popen]:
+        """
+        Terminate every server in the shared process group with a single
+        `killpg` call, escalating to SIGKILL for any that outlive the timeout.
+
+        Args:
+            processes: The server processes in the group
+            force_kill_timeout: How long to wait before force killing
+
+        Returns:
+            Processes that are still running and need individual cleanup
+        """
+        pgid = self._process_group
+        logger.info(f"Terminating server process group {pgid}...")
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+        deadline = time.monotonic() + force_kill_timeout
+        survivors = []
+        for process in processes:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                survivors.append(process)
+
+        if survivors:
+            logger.warning(
+                f"{len(survivors)} server process(es) in group {pgid} did not terminate gracefully after {force_kill_timeout}s, killing."
+            )
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            for process in survivors:
+                try:
+                    process.wait(timeout=1.0)
+                except subprocess.TimeoutExpired:
+                    continue
+
+        return [process for process in processes if process.poll() is None]
+
     def shutdown_all(self, force_kill_timeout: float = 5.0):
         """
         Shutdown all managed server processes.
@@ -534,29 +1027,47 @@ class MCPServerService:
         Args:
             force_kill_timeout: How long to wait before force killing each process
         """
-        if not self.active_servers:
+        if not self.active_servers and not self.in_process_servers:
             logger.info("No active MCP server services to shut down.")
             return
 
         logger.info(
-            f"Shutting down {len(self.active_servers)} MCP server service(s)..."
+            f"Shutting down {len(self.active_servers) + len(self.in_process_servers)} MCP server service(s)..."
         )
 
+        for in_process_server in self.in_process_servers:
+            self._cleanup_single_process(
+                in_process_server, in_process_server.args[0], force_kill_timeout
+            )
+
         # Create a copy of the list to iterate over, in case of concurrent modifications
-        servers_to_shutdown = self.active_servers.copy()
+        servers_to_shutdown = list(self.active_servers.values())
+
+        server_names = {info.process.pid: info.name for info in self.server_info}
+
+        group_members = [
+            server
+            for server in servers_to_shutdown
+            if server.pid in self._process_group_pids
+        ]
+        if group_members and self._process_group is not None:
+            try:
+                survivors = self._shutdown_process_group(
+                    group_members, force_kill_timeout
+                )
+                servers_to_shutdown = [
+                    server
+                    for server in servers_to_shutdown
+                    if server not in group_members or server in survivors
+                ]
+            except Exception as e:
+                logger.error(
+                    f"Error shutting down process group {self._process_group}: {e}"
+                )
 
         for server_process in servers_to_shutdown:
             try:
-                # Try to extract server name from the process args for better logging
-                server_name = "unknown"
-                if hasattr(server_process, "args") and len(server_process.args) > 2:
-                    # Try to extract name from the script content
-                    script_snippet = (
-                        server_process.args[2][:50]
-                        if server_process.args[2]
-                        else "unknown"
-                    )
-                    server_name = f"script:{script_snippet}..."
+                server_name = server_names.get(server_process.pid, "unknown")
 
                 self._cleanup_single_process(
                     server_process, server_name, force_kill_timeout
@@ -566,8 +1077,11 @@ class MCPServerService:
                     f"Error shutting down server process (PID {server_process.pid}): {e}"
                 )
 
-        self.active_servers = []
+        self.active_servers = {}
+        self.in_process_servers = []
         self.server_info = []
+        self._process_group = None
+        self._process_group_pids = set()
         self._keep_running = False
         logger.info("All managed MCP server services shut down.")
 
@@ -580,10 +1094,6 @@ class MCPServerService:
         self.shutdown_all()
 
 
-# Global singleton service instance - declared after class definition
-_singleton_service: "MCPServerService | None" = None
-
-
 # ------------------------------------------------------------------------------
 # Singleton Server Service Management
 # ------------------------------------------------------------------------------
@@ -597,11 +1107,7 @@ def get_server_service() -> MCPServerService:
     Returns:
         The singleton MCPServerService instance
     """
-    global _singleton_service
-    if _singleton_service is None:
-        _singleton_service = MCPServerService()
-        logger.debug("Created singleton MCPServerService instance")
-    return _singleton_service
+    return sys.modules[__name__]._singleton_service
 
 
 def shutdown_all_servers(force_kill_timeout: float = 5.0):
@@ -611,9 +1117,27 @@ def shutdown_all_servers(force_kill_timeout: float = 5.0):
     Args:
         force_kill_timeout: How long to wait before force killing each process
     """
-    global _singleton_service
-    if _singleton_service is not None:
-        _singleton_service.shutdown_all(force_kill_timeout)
+    service = globals().get("_singleton_service")
+    if service is not None:
+        service.shutdown_all(force_kill_timeout)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily creates the singleton `_singleton_service` on first access.
+    Once created it is stored as a plain module attribute, so later
+    lookups never reach this function.
+    """
+    if name != "_singleton_service":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _singleton_lock:
+        service = globals().get(name)
+        if service is None:
+            service = MCPServerService()
+            globals()[name] = service
+            logger.debug("Created singleton MCPServerService instance")
+    return service
 
 
 # ------------------------------------------------------------------------------
@@ -900,11 +1424,14 @@ def launch_stdio_mcp_server(
     debug_mode: bool = False,
     cwd: str | None = None,
     auto_keep_running: bool = True,
-) -> subprocess.Popen:
+    in_process: bool = False,
+) -> Union[subprocess.Popen, _InProcessServerProcess]:
     """
     Quickly launches an MCP server using FastMCP with stdio transport in a subprocess.
 
     The server is automatically managed by a singleton service instance.
+    When `in_process` is set, the server instead runs on a background
+    thread of the current process, serving this process's stdin/stdout.
 
     Args:
         name: Name of the MCP server.
@@ -914,9 +1441,14 @@ def launch_stdio_mcp_server(
         log_level: Logging level for the server.
         debug_mode: Whether to run FastMCP in debug mode.
         cwd: Optional current working directory for the subprocess.
+        in_process: Run the server on a thread instead of a subprocess.
+            Tools are registered directly, and `cwd` is ignored. The
+            process is not kept alive automatically, so the caller must
+            block (e.g. with `.wait()` on the returned handle).
 
     Returns:
-        The Popen object for the launched subprocess.
+        The Popen object for the launched subprocess, or a Popen-like
+        handle for an in-process server.
     """
     if tools is None:
         tools = []
@@ -925,6 +1457,16 @@ def launch_stdio_mcp_server(
 
     logger.info(f"Preparing to launch STDIN/OUT MCP Server: {name}")
     service = get_server_service()
+    if in_process:
+        return service.launch_in_process_server(
+            name=name,
+            instructions=instructions,
+            tools=tools,
+            dependencies=dependencies,
+            log_level=log_level,
+            debug_mode=debug_mode,
+        )
+
     process = service.launch_server_process(
         name=name,
         instructions=instructions,
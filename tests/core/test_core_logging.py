@@ -0,0 +1,57 @@
+import logging
+
+from ham.core.logging import LazyFormat
+
+
+class _FormatCounter:
+    """Counts how many times it is formatted into a message."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __format__(self, spec):
+        self.calls += 1
+        return "counted"
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestLazyFormat:
+    """Test cases for LazyFormat."""
+
+    def _make_logger(self, name, level):
+        logger = logging.getLogger(f"test_core_logging.{name}")
+        logger.setLevel(level)
+        logger.propagate = False
+        handler = _ListHandler()
+        logger.addHandler(handler)
+        return logger, handler
+
+    def test_lazy_format_str(self):
+        """Test that str() formats positional and keyword arguments."""
+        message = LazyFormat("{} rows from {path!r}", 3, path="a.csv")
+        assert str(message) == "3 rows from 'a.csv'"
+
+    def test_lazy_format_skipped_when_disabled(self):
+        """Test that a message below the logger level is never formatted."""
+        logger, handler = self._make_logger("disabled", logging.WARNING)
+        counter = _FormatCounter()
+        logger.debug(LazyFormat("value: {}", counter))
+        assert counter.calls == 0
+        assert handler.messages == []
+
+    def test_lazy_format_formatted_when_emitted(self):
+        """Test that an emitted message is formatted once by the handler."""
+        logger, handler = self._make_logger("enabled", logging.DEBUG)
+        counter = _FormatCounter()
+        message = LazyFormat("value: {}", counter)
+        logger.info(message)
+        assert handler.messages == ["value: counted"]
+        assert counter.calls == 1
@@ -0,0 +1,135 @@
+"""Tests for ham.core.models module."""
+
+import pytest
+from typing import List
+from ham.core.models import Model, field
+from ham.core.models.fields import float_field, int_field
+from ham.core.models.utils import create_model, make_model_factory
+
+
+class TestCreateModel:
+    """Test cases for the create_model function."""
+
+    def test_create_model_fields(self):
+        """Test creating a model with required and optional fields."""
+        User = create_model("User", name=str, age=(int, 0))
+        user = User(name="test")
+        assert issubclass(User, Model)
+        assert user.name == "test"
+        assert user.age == 0
+
+    def test_create_model_field_order(self):
+        """Test that required fields are ordered before optional fields."""
+        Item = create_model("Item", price=(float, 1.0), name=str)
+        assert list(Item.__annotations__) == ["name", "price"]
+
+    def test_create_model_with_field(self):
+        """Test creating a model with a field descriptor."""
+        Product = create_model("Product", tags=(List[str], field(default_factory=list)))
+        assert Product().tags == []
+
+    def test_create_model_cached(self):
+        """Test that identical definitions return the same class."""
+        first = create_model("Cached", name=str, age=(int, 0))
+        second = create_model("Cached", name=str, age=(int, 0))
+        assert first is second
+
+    def test_create_model_cache_distinguishes_defaults(self):
+        """Test that equal but distinct defaults do not share a class."""
+        first = create_model("Flag", value=(int, 1))
+        second = create_model("Flag", value=(int, True))
+        assert first is not second
+        assert second().value is True
+
+    def test_create_model_cache_distinguishes_nested_defaults(self):
+        """Test that equal container and float defaults do not share a class."""
+        first = create_model("Pair", value=(tuple, (1, 2)))
+        second = create_model("Pair", value=(tuple, (True, 2)))
+        assert first is not second
+        assert second().value[0] is True
+
+        positive = create_model("Zero", value=(float, 0.0))
+        negative = create_model("Zero", value=(float, -0.0))
+        assert positive is not negative
+        assert str(negative().value) == "-0.0"
+
+    def test_create_model_unhashable_default(self):
+        """Test that unhashable defaults still build a new class."""
+        first = create_model("Listed", items=(list, []))
+        second = create_model("Listed", items=(list, []))
+        assert first is not second
+
+    def test_create_model_keeps_validator_functions(self):
+        """Test that `_validators` maps names to the functions passed in."""
+
+        def check_name(cls, value):
+            return value
+
+        Checked = create_model(
+            "Checked", name=str, __validators__={"check_name": check_name}
+        )
+        assert Checked._validators == {"check_name": check_name}
+        assert Checked._validator_info["check_name"].func is check_name
+
+    def test_create_model_invalid_definition(self):
+        """Test that malformed tuple definitions raise ValueError."""
+        with pytest.raises(ValueError, match="must be a 2-tuple"):
+            create_model("Invalid", name=(str, "a", "b"))
+
+
+class TestMakeModelFactory:
+    """Test cases for make_model_factory."""
+
+    def test_factory_creates_named_models(self):
+        """Test that each factory call creates a distinct named class."""
+        factory = make_model_factory(name=str, age=(int, 0))
+        Admin = factory("Admin", module=__name__)
+        Guest = factory("Guest")
+        assert Admin is not Guest
+        assert Admin.__name__ == "Admin"
+        assert Admin.__module__ == __name__
+        assert Guest(name="bob").age == 0
+
+    def test_factory_models_do_not_share_mutable_attributes(self):
+        """Test that each class gets its own annotations and validators."""
+
+        def check_name(cls, value):
+            return value
+
+        factory = make_model_factory(
+            name=str, age=(int, 0), __validators__={"check_name": check_name}
+        )
+        First = factory("First")
+        Second = factory("Second")
+        assert First.__annotations__ is not Second.__annotations__
+        assert First._validators is not Second._validators
+
+        First._validators["extra"] = check_name
+        assert "extra" not in Second._validators
+
+
+class TestSharedFields:
+    """Test cases for the fields shared between typed field helpers."""
+
+    def test_identical_fields_are_shared(self):
+        """Test that identical scalar arguments return the same field."""
+        assert int_field(default=1, ge=0) is int_field(default=1, ge=0)
+        assert int_field(default=1) is not int_field(default=True)
+
+    def test_signed_zero_defaults_are_not_shared(self):
+        """Test that `0.0` and `-0.0` defaults build separate fields."""
+        positive = float_field(default=0.0)
+        negative = float_field(default=-0.0)
+        assert positive is not negative
+        assert str(negative.default) == "-0.0"
+
+    def test_equal_container_defaults_are_not_shared(self):
+        """Test that `(1, 2)` and `(True, 2)` defaults build separate fields."""
+        first = int_field(default=(1, 2))
+        second = int_field(default=(True, 2))
+        assert first is not second
+        assert second.default[0] is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
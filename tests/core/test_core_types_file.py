@@ -0,0 +1,118 @@
+import mimetypes
+
+import pytest
+
+from ham.core.types.file import File
+
+
+class TestFileFromPath:
+    """Test cases for File.from_path."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("notes.txt", "text/plain"),
+            ("photo.PNG", "image/png"),
+            ("archive.tar.gz", "application/x-tar"),
+            ("notes.txt.bz2", "text/plain"),
+            ("archive.tar.Z", "application/x-tar"),
+            ("notes.txt.Z", "text/plain"),
+            ("archive.tar.GZ", "application/gzip"),
+            ("unknown", None),
+        ],
+    )
+    def test_from_path_mime_type(self, tmp_path, name, expected):
+        """Test that MIME types match mimetypes.guess_type for the name."""
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        assert mimetypes.guess_type(name)[0] == expected
+        assert File.from_path(path).type == expected
+
+
+class TestFileFromDir:
+    """Test cases for File.from_dir."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        (tmp_path / "top.txt").write_text("top")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "nested.txt").write_text("nested")
+        return tmp_path
+
+    def test_from_dir_lists_entries(self, tree):
+        """Test that only direct entries are listed by default."""
+        files = {file.source.path.name: file for file in File.from_dir(tree)}
+        assert set(files) == {"top.txt", "sub"}
+        assert files["top.txt"].source.is_file
+        assert files["top.txt"].source.size == 3
+        assert files["top.txt"].type == "text/plain"
+        assert files["sub"].source.is_dir
+        assert files["sub"].type is None
+
+    def test_from_dir_recursive(self, tree):
+        """Test that recursive listing includes subdirectory entries."""
+        paths = {file.source.path for file in File.from_dir(tree, recursive=True)}
+        assert paths == {tree / "top.txt", tree / "sub", tree / "sub" / "nested.txt"}
+
+    def test_from_dir_does_not_follow_symlinked_dirs(self, tree):
+        """Test that symlinked directories are listed but not descended into."""
+        try:
+            (tree / "link").symlink_to(tree / "sub", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks are not supported here")
+
+        files = {
+            file.source.path: file for file in File.from_dir(tree, recursive=True)
+        }
+        assert tree / "link" in files
+        assert files[tree / "link"].source.is_dir
+        assert tree / "link" / "nested.txt" not in files
+
+
+class TestFileFromUrls:
+    """Test cases for File.from_urls."""
+
+    @pytest.fixture
+    def mock_transport(self, monkeypatch):
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(
+                200,
+                content=request.url.path.encode(),
+                headers={"content-type": "application/octet-stream"},
+            )
+
+        transport = httpx.MockTransport(handler)
+        async_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: async_client(transport=transport, **kwargs),
+        )
+
+    def test_from_urls_keeps_input_order(self, mock_transport):
+        """Test that results are returned in the order of the URLs."""
+        urls = [f"https://example.com/{index}" for index in range(5)]
+        files = File.from_urls(urls, concurrency=2)
+        assert [file.source.url for file in files] == urls
+        assert [file.data for file in files] == [
+            f"/{index}".encode() for index in range(5)
+        ]
+
+    def test_from_urls_failed_url_has_no_data(self, mock_transport):
+        """Test that a URL that fails to download still produces a file."""
+        ok, missing = File.from_urls(
+            ["https://example.com/ok", "https://example.com/missing"]
+        )
+        assert ok.data == b"/ok"
+        assert missing.source.url == "https://example.com/missing"
+        assert missing.data is None
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    def test_from_urls_rejects_invalid_concurrency(self, concurrency):
+        """Test that a concurrency below 1 raises instead of hanging."""
+        with pytest.raises(ValueError, match="concurrency"):
+            File.from_urls(["https://example.com/"], concurrency=concurrency)
@@ -0,0 +1,91 @@
+import sqlite3
+import time
+
+import pytest
+
+from ham.data.sql import create_database
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    return tmp_path / "items.db"
+
+
+def _raw_row_count(path) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestDatabaseExpiry:
+    """Test cases for expired item cleanup."""
+
+    def test_get_skips_expired_items(self):
+        """Test that get() stops returning an item once its TTL has passed."""
+        database = create_database("get_expiry")
+        database.add("short", id="short", ttl=1)
+        database.add("kept", id="kept")
+
+        assert database.get("short").item == "short"
+        time.sleep(1.1)
+        assert database.get("short") is None
+
+        kept = database.get("kept")
+        assert kept.item == "kept"
+        assert kept.created_at.tzinfo is not None
+
+    def test_cleanup_from_count_is_committed(self, database_path):
+        """Test that expired items removed by count() stay removed."""
+        database = create_database("expiry", path=database_path)
+        database.add("short", ttl=1)
+        database.add("kept")
+
+        time.sleep(1.1)
+        assert database.count() == 1
+        assert _raw_row_count(database_path) == 1
+
+        database.add("another")
+        assert len(database.query()) == 2
+        assert _raw_row_count(database_path) == 2
+
+
+class TestDatabaseAddMany:
+    """Test cases for Database.add_many."""
+
+    def test_add_many_mismatched_ids(self):
+        """Test that a different number of ids and items raises ValueError."""
+        database = create_database("mismatched")
+        with pytest.raises(ValueError, match="number of ids"):
+            database.add_many(["a", "b"], ids=["1"])
+        assert database.count() == 0
+
+    def test_add_many_empty(self):
+        """Test that an empty list stores nothing and returns no ids."""
+        database = create_database("empty")
+        assert database.add_many([]) == []
+        assert database.count() == 0
+
+    def test_add_many_returns_ids_in_order(self):
+        """Test that generated and given ids are returned in item order."""
+        database = create_database("ordered")
+        generated = database.add_many(["a", "b", "c"])
+        assert len(set(generated)) == 3
+        assert [database.get(id).item for id in generated] == ["a", "b", "c"]
+
+        given = database.add_many(["x", "y"], ids=["2", "1"])
+        assert given == ["2", "1"]
+        assert database.get("2").item == "x"
+        assert database.get("1").item == "y"
+
+    def test_add_many_upserts_existing_ids(self):
+        """Test that existing ids are updated and keep their creation time."""
+        database = create_database("upsert")
+        database.add("old", id="1", filters={"version": 1})
+        created_at = database.get("1").created_at
+
+        database.add_many(["new", "other"], ids=["1", "2"], filters={"version": 2})
+
+        assert database.count() == 2
+        updated = database.get("1")
+        assert updated.item == "new"
+        assert updated.filters == {"version": 2}
+        assert updated.created_at == created_at